@@ -7,7 +7,6 @@ import os
 from typing import Dict, Any, List
 from urllib import response
 from langchain.schema.runnable import Runnable, RunnableLambda
-from langchain.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import trim_messages, HumanMessage, AIMessage, SystemMessage
 from langchain.schema import HumanMessage as LegacyHumanMessage, AIMessage as LegacyAIMessage
@@ -15,7 +14,8 @@ from langchain.schema import HumanMessage as LegacyHumanMessage, AIMessage as Le
 from ..core.retriever import RAGRetriever
 from ..core.personality import PersonalityPromptManager
 from ..core.doc_matcher import SmartDocumentationMatcher
-from ..prompts.llm_controller_prompts import get_controller_prompt_template
+from ..core.semantic_cache import SemanticCache
+from ..prompts.llm_controller_prompts import render_controller_prompt, analyze_memory_vs_retrieval_intent
 
 
 class ModernConversationMemory:
@@ -96,6 +96,14 @@ class LLMControlledRAG(Runnable):
         self.controller_llm = ChatOpenAI(model="gpt-3.5-turbo", temperature=0.2)
         self.generator_llm = ChatOpenAI(model="gpt-3.5-turbo", temperature=0.7)
         
+        # Controller decisions for paraphrased fresh-information queries, one
+        # cache per personality (the decision is made for that persona)
+        self.strategy_caches: Dict[str, SemanticCache] = {}
+        
+        # (query, normalised embedding) from the last strategy cache lookup,
+        # reused when the controller searches with the query unchanged
+        self._last_query_embedding = None
+        
         # Initialize MODERN LangChain Memory (replaces deprecated ConversationBufferWindowMemory)
         self.memory = ModernConversationMemory(
             k=memory_window_size,  # Keep last N conversation turns
@@ -298,20 +306,40 @@ class LLMControlledRAG(Runnable):
         memory_context = self._get_memory_context()
         
         # Modify controller prompt based on analogy setting
-        base_prompt = get_controller_prompt_template()
+        analogy_instruction = ""
         if not enable_analogies and not self._is_tech_query(query):
             analogy_instruction = "\n\nIMPORTANT: User has disabled tech analogies for non-technical questions. Avoid suggesting technical comparisons for casual/non-tech topics."
-            base_prompt += analogy_instruction
         
-        controller_prompt = ChatPromptTemplate.from_template(base_prompt)
-        
-        result = self.controller_llm.invoke(
-            controller_prompt.format(
-                query=query, 
-                personality=personality,
-                memory_context=memory_context
-            )
+        # Only fresh-information queries on the default prompt, asked before
+        # any conversation, are cacheable: with history in the prompt even a
+        # keyword-free follow-up may be routed to CONTEXT_SEARCH or FOLLOW_UP
+        cacheable = (
+            not analogy_instruction
+            and not getattr(self.memory.chat_memory, 'messages', [])
+            and analyze_memory_vs_retrieval_intent(query)["intent"] == "normal_search"
         )
+        strategy_cache = self._get_strategy_cache(personality)
+        query_vector = None
+        self._last_query_embedding = None
+        if cacheable:
+            try:
+                cached_strategy, query_vector = strategy_cache.lookup(query)
+                self._last_query_embedding = (query, query_vector)
+                if cached_strategy is not None:
+                    print(f"🧠 Controller Decision (cached): {cached_strategy['query_type']}")
+                    return dict(cached_strategy)
+            except Exception as e:
+                print(f"⚠️ Strategy cache lookup failed: {e}")
+                cacheable = False
+        
+        controller_prompt = render_controller_prompt(
+            query=query, 
+            personality=personality,
+            memory_context=memory_context,
+            instructions=analogy_instruction
+        )
+        
+        result = self.controller_llm.invoke(controller_prompt)
         
         # Parse the controller's decision with new fields
         content = result.content
@@ -326,8 +354,26 @@ class LLMControlledRAG(Runnable):
         
         print(f"🧠 Controller Decision: {strategy['query_type']} - {strategy['reasoning']}")
         
+        if cacheable and strategy["query_type"] == "NORMAL_SEARCH":
+            strategy_cache.add(query, dict(strategy), query_vector)
+        
         return strategy
     
+    def _get_strategy_cache(self, personality: str) -> SemanticCache:
+        """Controller decision cache of a personality, created on first use"""
+        if personality not in self.strategy_caches:
+            self.strategy_caches[personality] = SemanticCache(self.retriever.embeddings.embed_query)
+        return self.strategy_caches[personality]
+    
+    def _search_embedding(self, search_terms: str):
+        """
+        Embedding from the strategy cache lookup when the search terms are the
+        query itself, so a cache miss doesn't embed the same text twice
+        """
+        if self._last_query_embedding and self._last_query_embedding[0] == search_terms:
+            return self._last_query_embedding[1].tolist()
+        return None
+    
     def _is_tech_query(self, query: str) -> bool:
         """Check if query is technical in nature"""
         tech_keywords = [
@@ -494,7 +540,9 @@ class LLMControlledRAG(Runnable):
         print(f"📄 DEBUG: Max documents limit: {max_documents}")
         
         # Get documents with max_documents limit
-        doc_score_pairs = self.retriever.retrieve_context(search_terms, top_k=max_documents)
+        doc_score_pairs = self.retriever.retrieve_context(
+            search_terms, top_k=max_documents, query_embedding=self._search_embedding(search_terms)
+        )
         
         print(f"🔍 DEBUG: Found {len(doc_score_pairs)} documents")
         
@@ -552,7 +600,10 @@ class LLMControlledRAG(Runnable):
         
         # Get documents - retrieve more initially to have options for filtering
         initial_retrieve_count = max(10, max_documents * 2)  # Get at least 2x what we need
-        doc_score_pairs = self.retriever.retrieve_context(search_terms, top_k=initial_retrieve_count)
+        doc_score_pairs = self.retriever.retrieve_context(
+            search_terms, top_k=initial_retrieve_count,
+            query_embedding=self._search_embedding(search_terms)
+        )
         
         # Apply similarity threshold filtering
         filtered_docs = [(doc, score) for doc, score in doc_score_pairs if score >= similarity_threshold]
@@ -656,11 +707,11 @@ class LLMControlledRAG(Runnable):
     
     def _generate_response(self, query: str, context: str, personality: str, strategy: Dict[str, Any]) -> str:
         """Generate response with IMPROVED memory prioritization + simple video links""" 
-        # Import the personality descriptions
-        from ..prompts.personality_prompts import get_personality_description
+        # Static personality prompt + instructions go in the system message,
+        # per-turn history/context/question go in the user message
+        from ..prompts.personality_prompts import build_messages
         
-        # Get the personality description from external file
-        personality_description = get_personality_description(personality)
+        personality_name = personality.title()
         
         # Check if this is a memory-focused query
         query_type = strategy.get("query_type", "NORMAL_SEARCH")
@@ -673,14 +724,7 @@ class LLMControlledRAG(Runnable):
             comprehensive_summary = self._generate_comprehensive_memory_summary(query)
             
             # Memory-priority response template with better coverage
-            system_prompt = """{personality_description}
-            
-            The user is asking about our previous conversation. Use the comprehensive conversation summary below to provide a complete answer.
-            
-            COMPREHENSIVE CONVERSATION SUMMARY:
-            {comprehensive_summary}
-            
-            User Question: {query}
+            instructions = f"""The user is asking about our previous conversation. Use the comprehensive conversation summary provided to give a complete answer.
             
             Respond as {personality_name} by providing a thorough recap of ALL topics we discussed. Include:
             - All major topics covered (Docker, Excel, Python, etc.)
@@ -696,15 +740,12 @@ class LLMControlledRAG(Runnable):
             
             Be comprehensive - don't leave out any topics we discussed!"""
             
-            response = self.generator_llm.invoke([{
-                "role": "system", 
-                "content": system_prompt.format(
-                    personality_description=personality_description,
-                    comprehensive_summary=comprehensive_summary,
-                    query=query,
-                    personality_name=personality.title()
-                )
-            }])
+            response = self.generator_llm.invoke(build_messages(
+                personality,
+                f"User Question: {query}",
+                f"COMPREHENSIVE CONVERSATION SUMMARY:\n{comprehensive_summary}",
+                instructions
+            ))
             
             return response.content  # No video links for memory queries
             
@@ -715,30 +756,17 @@ class LLMControlledRAG(Runnable):
             memory_context = self._get_memory_context()
             
             # Context-aware response (builds on previous topics)
-            system_prompt = """{personality_description}
-            
-            CONVERSATION HISTORY:
-            {memory_context}
-            
-            CURRENT CONTEXT: {context}
-            
-            User Question: {query}
-            
-            This question builds on our previous conversation. Respond as {personality_name} by:
+            instructions = f"""This question builds on our previous conversation. Respond as {personality_name} by:
             1. Briefly referencing our previous discussion if relevant
             2. Using the current context to provide new information
             3. Building progressively on what we've already covered"""
             
-            response = self.generator_llm.invoke([{
-                "role": "system", 
-                "content": system_prompt.format(
-                    personality_description=personality_description,
-                    memory_context=memory_context,
-                    context=context,
-                    query=query,
-                    personality_name=personality.title()
-                )
-            }])
+            response = self.generator_llm.invoke(build_messages(
+                personality,
+                f"User Question: {query}",
+                f"CONVERSATION HISTORY:\n{memory_context}\n\nCURRENT CONTEXT: {context}",
+                instructions
+            ))
             
         else:
             print("🧠 Generating NORMAL response with memory awareness")
@@ -747,28 +775,15 @@ class LLMControlledRAG(Runnable):
             memory_context = self._get_memory_context()
             
             # Normal response with memory awareness
-            system_prompt = """{personality_description}
-            
-            CONVERSATION HISTORY:
-            {memory_context}
-            
-            CURRENT CONTEXT: {context}
-            
-            User Question: {query}
-            
-            Respond as {personality_name} using both our conversation history and the current context. 
+            instructions = f"""Respond as {personality_name} using both our conversation history and the current context. 
             If this relates to something we discussed earlier, reference it appropriately."""
             
-            response = self.generator_llm.invoke([{
-                "role": "system", 
-                "content": system_prompt.format(
-                    personality_description=personality_description,
-                    memory_context=memory_context,
-                    context=context,
-                    query=query,
-                    personality_name=personality.title()
-                )
-            }])
+            response = self.generator_llm.invoke(build_messages(
+                personality,
+                f"User Question: {query}",
+                f"CONVERSATION HISTORY:\n{memory_context}\n\nCURRENT CONTEXT: {context}",
+                instructions
+            ))
 
         # START OF VIDEO INTEGRATION - Add video links for non-memory queries
         final_response = response.content
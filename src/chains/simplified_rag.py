@@ -8,7 +8,7 @@ from typing import Dict, Any, List
 from langchain.schema.runnable import Runnable
 from langchain.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import trim_messages, HumanMessage, AIMessage, SystemMessage
+from langchain_core.messages import trim_messages, HumanMessage, AIMessage
 
 from ..core.retriever import RAGRetriever
 from ..core.doc_matcher import SmartDocumentationMatcher
@@ -220,20 +220,24 @@ class SimplifiedRAG(Runnable):
                           retrieval_context: str, doc_links: str, video_info: List) -> str:
         """Generate response with enhanced prompt for natural reasoning"""
         
-        # Import personality description
-        from ..prompts.personality_prompts import get_personality_description
-        personality_description = get_personality_description(personality)
+        from ..prompts.personality_prompts import build_messages
         
-        # Create enhanced prompt
-        system_prompt = f"""{personality_description}
-
-IMPORTANT RESPONSE GUIDELINES:
+        # Static per-personality instructions stay in the system message
+        instructions = f"""IMPORTANT RESPONSE GUIDELINES:
 - Keep responses between 50-150 words
 - Use bullet points for explanations when helpful
 - Be concise and scannable
 - Only include video/documentation references if truly relevant and not already mentioned recently
 
-CONVERSATION CONTEXT:
+Instructions:
+1. Use conversation context to avoid repeating information or references already shared
+2. If user asks about a specific video by name, search the available videos and provide detailed information
+3. Provide helpful, concise responses with bullet points when appropriate
+4. Only include video/doc references if they add new value and weren't shared recently
+5. Respond naturally as {personality} personality"""
+        
+        # Per-turn context goes in the user message
+        context = f"""CONVERSATION CONTEXT:
 {conversation_context}
 
 CURRENT RETRIEVAL CONTEXT:
@@ -243,21 +247,11 @@ AVAILABLE VIDEOS FOR RESEARCH:
 {self._format_video_list(video_info)}
 
 AVAILABLE DOCUMENTATION:
-{doc_links}
-
-USER QUESTION: {query}
+{doc_links}"""
 
-Instructions:
-1. Use conversation context to avoid repeating information or references already shared
-2. If user asks about a specific video by name, search the available videos and provide detailed information
-3. Provide helpful, concise responses with bullet points when appropriate
-4. Only include video/doc references if they add new value and weren't shared recently
-5. Respond naturally as {personality} personality"""
-
-        response = self.llm.invoke([
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=query)
-        ])
+        response = self.llm.invoke(
+            build_messages(personality, f"USER QUESTION: {query}", context, instructions)
+        )
         
         return response.content
     
@@ -11,6 +11,14 @@ import openai
 import numpy as np
 
 
+def batched_cosine(queries: np.ndarray, docs: np.ndarray) -> np.ndarray:
+    """Cosine similarity of every query row against every doc row, as one matmul"""
+    queries = np.atleast_2d(queries)
+    queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    docs = docs / np.linalg.norm(docs, axis=1, keepdims=True)
+    return queries @ docs.T
+
+
 class SmartDocumentationMatcher:
     """
     Smart documentation matcher using OpenAI embeddings for semantic matching.
@@ -82,13 +90,6 @@ class SmartDocumentationMatcher:
             print(f"❌ Error generating embeddings: {e}")
             self.doc_embeddings = None
     
-    def cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """Calculate cosine similarity between two vectors"""
-        dot_product = np.dot(vec1, vec2)
-        norm_a = np.linalg.norm(vec1)
-        norm_b = np.linalg.norm(vec2)
-        return dot_product / (norm_a * norm_b)
-    
     def extract_keywords_from_response(self, response_text: str) -> List[str]:
         """Extract relevant keywords from the AI response"""
         # Clean and normalize the response
@@ -121,34 +122,50 @@ class SmartDocumentationMatcher:
         
         return found_keywords
     
-    def match_documentation(self, response_text: str, top_k: int = 3, 
-                          min_similarity: float = 0.1) -> List[Dict]:
-        """Match documentation based on response content using OpenAI embeddings"""
-        if not self.docs or self.doc_embeddings is None:
-            return []
-        
+    def build_search_text(self, response_text: str) -> tuple:
+        """Return (search text, keywords) used to embed a response for matching"""
         # Extract keywords from response
         keywords = self.extract_keywords_from_response(response_text)
         
         # Create search query from response text and keywords
         search_text = response_text.lower() + ' ' + ' '.join(keywords)
+        return search_text, keywords
+    
+    def embed_queries(self, queries: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Embed the search text of several queries in a single embeddings request.
+        Pass a vector back to match_documentation() as search_embedding.
+        """
+        search_texts = [self.build_search_text(query)[0] for query in queries]
+        response = self.client.embeddings.create(
+            model="text-embedding-3-small",
+            input=search_texts
+        )
+        return {
+            query: np.array(item.embedding)
+            for query, item in zip(queries, response.data)
+        }
+    
+    def match_documentation(self, response_text: str, top_k: int = 3, 
+                          min_similarity: float = 0.1,
+                          search_embedding: np.ndarray = None) -> List[Dict]:
+        """Match documentation based on response content using OpenAI embeddings"""
+        if not self.docs or self.doc_embeddings is None:
+            return []
+        
+        search_text, keywords = self.build_search_text(response_text)
         
         try:
-            # Generate embedding for search text
-            response = self.client.embeddings.create(
-                model="text-embedding-3-small",
-                input=[search_text]
-            )
-            
-            search_embedding = np.array(response.data[0].embedding)
+            # Generate embedding for search text (unless already embedded)
+            if search_embedding is None:
+                response = self.client.embeddings.create(
+                    model="text-embedding-3-small",
+                    input=[search_text]
+                )
+                search_embedding = np.array(response.data[0].embedding)
             
             # Calculate similarities with all documentation embeddings
-            similarities = []
-            for doc_embedding in self.doc_embeddings:
-                similarity = self.cosine_similarity(search_embedding, doc_embedding)
-                similarities.append(similarity)
-            
-            similarities = np.array(similarities)
+            similarities = batched_cosine(search_embedding, self.doc_embeddings)[0]
             
             # Get top matches above threshold
             top_indices = np.argsort(similarities)[::-1][:top_k]
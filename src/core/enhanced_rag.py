@@ -19,10 +19,14 @@ class EnhancedRAGEngine:
     Extracted from notebook and preserved exactly as working implementation.
     """
     
-    def __init__(self):
-        self.retriever = RAGRetriever()
-        self.prompt_manager = PersonalityPromptManager()
-        self.doc_matcher = SmartDocumentationMatcher()
+    def __init__(self, retriever: RAGRetriever = None,
+                 prompt_manager: PersonalityPromptManager = None,
+                 doc_matcher: SmartDocumentationMatcher = None):
+        # Components can be passed in so callers that already hold them
+        # (e.g. a test session) don't reconnect or re-embed the docs
+        self.retriever = retriever or RAGRetriever()
+        self.prompt_manager = prompt_manager or PersonalityPromptManager()
+        self.doc_matcher = doc_matcher or SmartDocumentationMatcher()
         self.client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
         print("✅ Enhanced RAG Engine ready with smart documentation!")
     
@@ -59,13 +63,13 @@ class EnhancedRAGEngine:
             context_stats = self.retriever.get_context_stats(doc_score_pairs)
             
             # Step 2: Generate AI response with personality style
-            prompt = self.prompt_manager.build_prompt(
+            messages = self.prompt_manager.build_messages(
                 personality, user_query, context, context_stats
             )
             
             response = self.client.chat.completions.create(
                 model="gpt-3.5-turbo",
-                messages=[{"role": "system", "content": prompt}],
+                messages=messages,
                 temperature=0.7
             )
             
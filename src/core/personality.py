@@ -2,9 +2,9 @@
 Personality Prompt Manager - Now uses extracted prompts
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 from ..prompts.personality_prompts import (
-    get_personality_prompt, 
+    build_messages,
     analyze_query_type, 
     get_response_guidance
 )
@@ -18,12 +18,9 @@ class PersonalityPromptManager:
     def __init__(self):
         print("✅ Enhanced personality prompts loaded from external files!")
     
-    def build_prompt(self, personality: str, user_query: str, context: str, 
-                    context_stats: Dict = None, documentation_links: str = ""):
-        """Build enhanced prompt using extracted personality prompts"""
-        
-        # Get the personality system prompt
-        system_prompt = get_personality_prompt(personality)
+    def build_messages(self, personality: str, user_query: str, context: str,
+                       context_stats: Dict = None, documentation_links: str = "") -> List[Dict[str, str]]:
+        """Build chat messages: static personality system prompt + per-turn user message"""
         
         # Build context information section
         context_info = ""
@@ -37,20 +34,28 @@ class PersonalityPromptManager:
         # Get response guidance
         response_guidance = get_response_guidance(personality, user_query)
         
-        # Build the complete prompt
-        prompt = f"""{system_prompt}
-
-QUERY ANALYSIS: {query_analysis}
+        context_block = f"""QUERY ANALYSIS: {query_analysis}
 
 RELEVANT CONTEXT FROM VIDEO TRANSCRIPTS:{context_info}
-{context}
-
-USER QUESTION: {user_query}
+{context}"""
+        
+        question_block = f"""USER QUESTION: {user_query}
 
 Please respond as {personality.title()}, using the context from the video transcripts while maintaining your authentic personality and teaching style. {response_guidance}"""
         
         # Add documentation links if available
         if documentation_links:
-            prompt += f"\n\nAfter your response, you may also include these relevant documentation links:{documentation_links}"
+            question_block += f"\n\nAfter your response, you may also include these relevant documentation links:{documentation_links}"
         
-        return prompt
\ No newline at end of file
+        return build_messages(personality, question_block, context_block)
+    
+    def build_prompt(self, personality: str, user_query: str, context: str, 
+                    context_stats: Dict = None, documentation_links: str = ""):
+        """
+        Build the same prompt as a single string.
+        Prefer build_messages() so the system prompt stays a reusable prefix.
+        """
+        messages = self.build_messages(
+            personality, user_query, context, context_stats, documentation_links
+        )
+        return "\n\n".join(message["content"] for message in messages)
@@ -21,11 +21,11 @@ class RAGRetriever:
     Extracted from notebook and preserved exactly as working implementation.
     """
     
-    def __init__(self, index_name: str = "networkchuck-ai-chatbot"):
+    def __init__(self, index_name: str = "networkchuck-ai-chatbot", vectorstore=None):
         self.index_name = index_name
-        self.setup_components()
+        self.setup_components(vectorstore)
         
-    def setup_components(self):
+    def setup_components(self, vectorstore=None):
         """Setup embeddings and vectorstore connection"""
         # Initialize embeddings
         self.embeddings = OpenAIEmbeddings(
@@ -33,6 +33,12 @@ class RAGRetriever:
             openai_api_key=os.getenv('OPENAI_API_KEY')
         )
         
+        # Use a ready-made vectorstore (e.g. a local test index) if given
+        if vectorstore is not None:
+            self.vectorstore = vectorstore
+            print("✅ RAG Retriever ready with provided vectorstore!")
+            return
+        
         # Connect to vectorstore
         pc = Pinecone(api_key=os.getenv('PINECONE_API_KEY'))
         index = pc.Index(self.index_name)
@@ -43,14 +49,28 @@ class RAGRetriever:
         )
         print("✅ RAG Retriever ready with general search (no personality filtering)!")
     
-    def retrieve_context(self, query: str, top_k: int = 5) -> List[Tuple]:
+    def embed_queries(self, queries: List[str]) -> Dict[str, List[float]]:
+        """
+        Embed several queries in a single embeddings request.
+        Pass a vector back to retrieve_context() as query_embedding.
+        """
+        return dict(zip(queries, self.embeddings.embed_documents(list(queries))))
+    
+    def retrieve_context(self, query: str, top_k: int = 5,
+                         query_embedding: List[float] = None) -> List[Tuple]:
         """Retrieve context WITHOUT personality filtering - general search"""
         # NO metadata filter - search across all personalities
-        docs = self.vectorstore.similarity_search_with_score(
-            query=query, 
-            k=top_k
-            # Removed: filter=metadata_filter
-        )
+        if query_embedding is not None:
+            docs = self.vectorstore.similarity_search_by_vector_with_score(
+                query_embedding,
+                k=top_k
+            )
+        else:
+            docs = self.vectorstore.similarity_search_with_score(
+                query=query, 
+                k=top_k
+                # Removed: filter=metadata_filter
+            )
         return [(doc, score) for doc, score in docs]
     
     def format_context(self, doc_score_pairs: List[Tuple], max_length: int = 3000) -> str:
@@ -0,0 +1,90 @@
+"""
+Semantic Cache - Reuse results for near-duplicate queries
+Matches queries by embedding cosine similarity instead of exact text
+"""
+
+from typing import Any, Callable, List, Optional
+import numpy as np
+
+
+class SemanticCache:
+    """
+    Small in-process cache keyed on query embeddings.
+    A lookup returns the stored value of the most similar cached query if its
+    cosine similarity reaches the threshold; the least recently used entry is
+    evicted once the cache is full.
+    
+    Cached embeddings are stored as int8 codes with one float scale per vector
+    (symmetric quantisation), a quarter of the float32 footprint. The cache
+    only routes queries, so int8 precision is plenty for the similarity check.
+    """
+
+    def __init__(self, embed_fn: Callable[[str], List[float]], threshold: float = 0.95,
+                 max_entries: int = 10_000):
+        self.embed_fn = embed_fn
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._codes = None  # (max_entries, dim) int8 codes, allocated on first add
+        self._scales = np.zeros(max_entries, dtype=np.float32)
+        self._values: List[Any] = []
+        self._last_used = np.zeros(max_entries, dtype=np.int64)
+        self._clock = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _embed(self, text: str) -> np.ndarray:
+        """Embed and L2-normalise text so a dot product is the cosine similarity"""
+        vector = np.asarray(self.embed_fn(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _touch(self, slot: int):
+        self._clock += 1
+        self._last_used[slot] = self._clock
+
+    def lookup(self, text: str) -> tuple:
+        """
+        Return (value, vector) for the nearest cached query, or (None, vector)
+        on a miss. Pass the vector back to add() to avoid embedding twice.
+        """
+        vector = self._embed(text)
+        if not self._values:
+            return None, vector
+
+        count = len(self._values)
+        similarities = (self._codes[:count] @ vector) * self._scales[:count]
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None, vector
+
+        self._touch(best)
+        return self._values[best], vector
+
+    def add(self, text: str, value: Any, vector: Optional[np.ndarray] = None):
+        """Cache value under the embedding of text, evicting the LRU entry if full"""
+        if vector is None:
+            vector = self._embed(text)
+        if self._codes is None:
+            self._codes = np.zeros((self.max_entries, vector.shape[0]), dtype=np.int8)
+
+        if len(self._values) < self.max_entries:
+            slot = len(self._values)
+            self._values.append(value)
+        else:
+            slot = int(np.argmin(self._last_used))
+            self._values[slot] = value
+
+        peak = float(np.max(np.abs(vector)))
+        scale = peak / 127 if peak else 1.0
+        self._codes[slot] = np.round(vector / scale).astype(np.int8)
+        self._scales[slot] = scale
+        self._touch(slot)
+
+    def clear(self):
+        """Drop all cached entries"""
+        self._codes = None
+        self._scales[:] = 0
+        self._values = []
+        self._last_used[:] = 0
+        self._clock = 0
@@ -5,7 +5,9 @@ Using ElevenLabs Python SDK (official API structure)
 
 import os
 import base64
-from typing import Dict, Optional
+import asyncio
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
 import gradio as gr
 
 from elevenlabs.client import ElevenLabs
@@ -143,6 +145,49 @@ def speech_to_text(audio_data) -> str:
         return "Speech recognition failed"
 
 
+# Whisper API requests in flight at once in transcribe_many
+WHISPER_CONCURRENCY = 8
+
+
+async def transcribe_many(audio_files: Sequence[Union[str, Path]],
+                          concurrency: int = WHISPER_CONCURRENCY) -> List[Union[str, Exception]]:
+    """
+    Transcribe several audio files with OpenAI Whisper concurrently
+    
+    Every request is submitted up front (at most `concurrency` in flight)
+    through one async client, so a batch costs about one round trip per
+    `concurrency` files instead of one per file.
+    Returns the transcripts in input order; a failed file gives its exception.
+    """
+    import openai
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async with openai.AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY')) as client:
+        
+        async def transcribe(audio_file) -> str:
+            audio_file = Path(audio_file)
+            async with semaphore:
+                # File read off the event loop, so it overlaps other uploads
+                audio_bytes = await asyncio.to_thread(audio_file.read_bytes)
+                response = await client.audio.transcriptions.create(
+                    model="whisper-1",
+                    file=(audio_file.name, audio_bytes),
+                    response_format="text"
+                )
+            return response.strip()
+        
+        return await asyncio.gather(
+            *(transcribe(audio_file) for audio_file in audio_files),
+            return_exceptions=True
+        )
+
+
+def transcribe_files(audio_files: Sequence[Union[str, Path]]) -> List[Union[str, Exception]]:
+    """Blocking wrapper around transcribe_many for scripts without an event loop"""
+    return asyncio.run(transcribe_many(audio_files))
+
+
 # Simple TTS function for use in app.py
 def text_to_speech_simple(text: str, personality: str) -> Optional[bytes]:
     """Simple wrapper for TTS functionality"""
@@ -79,10 +79,12 @@ class EmbeddingPipeline:
             
         # Initialize components
         try:
-            # OpenAI Embeddings
+            # OpenAI Embeddings (up to 2048 texts per request, the API's
+            # input limit; transcript segments are short enough to fit)
             self.embeddings = OpenAIEmbeddings(
                 model="text-embedding-3-small",
-                openai_api_key=os.getenv('OPENAI_API_KEY')
+                openai_api_key=os.getenv('OPENAI_API_KEY'),
+                chunk_size=2048
             )
             
             # Pinecone
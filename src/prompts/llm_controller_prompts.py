@@ -2,17 +2,21 @@
 LLM Controller Prompts - FIXED to prevent over-detection of memory queries
 """
 
-def get_controller_prompt_template() -> str:
-    """
-    ULTRA-STRICT controller prompt - prevents false memory detection
-    """
-    return """You are a smart retrieval controller for a RAG system with conversation memory.
+import re
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 
-CRITICAL RULE: MEMORY_PRIORITY is ONLY for explicit conversation recall requests. Default to NORMAL_SEARCH.
 
-USER QUESTION: {query}
-PERSONALITY: {personality}
-CONVERSATION HISTORY: {memory_context}
+# ULTRA-STRICT controller prompt - prevents false memory detection
+#
+# Everything in CONTROLLER_RULES is identical on every turn; the per-turn
+# fields only appear in the trailing query block. Keep it that way: any
+# variable text placed inside the rules breaks upstream prefix caching.
+CONTROLLER_RULES = """You are a smart retrieval controller for a RAG system with conversation memory.
+
+CRITICAL RULE: MEMORY_PRIORITY is ONLY for explicit conversation recall requests. Default to NORMAL_SEARCH.
 
 **STRICT MEMORY-ONLY QUERIES** (Use MEMORY_PRIORITY):
 Must contain these EXACT phrases:
@@ -81,119 +85,129 @@ AVOID_BIAS: [yes/no]
 FOCUS_AREA: [domain or "conversation_history"]
 REASONING: [explain your decision]"""
 
+CONTROLLER_QUERY_BLOCK = """
+
+---
+USER QUESTION: {query}
+PERSONALITY: {personality}
+CONVERSATION HISTORY: {memory_context}"""
+
+CONTROLLER_PROMPT_TEMPLATE = CONTROLLER_RULES + CONTROLLER_QUERY_BLOCK
 
-def analyze_memory_vs_retrieval_intent(query: str) -> dict:
+
+def get_controller_prompt_template() -> str:
+    """Return the controller prompt template"""
+    return CONTROLLER_PROMPT_TEMPLATE
+
+
+def render_controller_prompt(query: str, personality: str, memory_context: str,
+                             instructions: str = "") -> str:
     """
-    ULTRA-STRICT analysis to prevent false memory detection
+    Fill the controller template by plain concatenation (no format parsing).
+    Optional extra instructions go after the static rules, before the
+    per-turn fields, so the cacheable prefix stays intact.
     """
-    query_lower = query.lower().strip()
-    
-    # VERY STRICT memory indicators - must be explicit
-    strict_memory_phrases = [
-        "remind me",
-        "what did we discuss",
-        "what did we talk about", 
-        "what were we talking about",
-        "summarize our conversation",
-        "recall our discussion",
-        "what topics have we covered",
-        "what was that thing you mentioned"
-    ]
-    
-    # Immediate disqualifiers (never memory)
-    greeting_patterns = [
-        "hello", "hi", "hey", "good morning", "good afternoon", 
-        "how are you", "what's up", "greetings"
-    ]
-    
-    info_request_patterns = [
-        "what is", "what's", "tell me about", "explain", "how to",
-        "how do i", "show me", "describe", "define"
-    ]
-    
-    analysis = {
-        "intent": "normal_search",
-        "confidence": "high",
-        "indicators": [],
-        "reasoning": ""
-    }
-    
-    # Check if it's a greeting - NEVER memory
-    if any(greeting in query_lower for greeting in greeting_patterns):
-        analysis["reasoning"] = "Greeting detected - not a memory request"
-        return analysis
-    
-    # Check if it's an information request - NEVER memory  
-    if any(pattern in query_lower for pattern in info_request_patterns):
-        analysis["reasoning"] = "Information request detected - not memory recall"
-        return analysis
+    return (
+        f"{CONTROLLER_RULES}{instructions}\n\n---\n"
+        f"USER QUESTION: {query}\n"
+        f"PERSONALITY: {personality}\n"
+        f"CONVERSATION HISTORY: {memory_context}"
+    )
+
+
+# VERY STRICT memory indicators - must be explicit
+STRICT_MEMORY_PHRASES = (
+    "remind me",
+    "what did we discuss",
+    "what did we talk about",
+    "what were we talking about",
+    "summarize our conversation",
+    "recall our discussion",
+    "what topics have we covered",
+    "what was that thing you mentioned"
+)
+
+# Immediate disqualifiers (never memory)
+GREETING_PATTERNS = (
+    "hello", "hi", "hey", "good morning", "good afternoon",
+    "how are you", "what's up", "greetings"
+)
+
+INFO_REQUEST_PATTERNS = (
+    "what is", "what's", "tell me about", "explain", "how to",
+    "how do i", "show me", "describe", "define"
+)
+
+# Context pronouns (but not for simple questions)
+CONTEXT_PRONOUNS = ("that one", "which one", "the other", "what about that")
+
+
+def _compile_keywords(keywords) -> re.Pattern:
+    """Compile a keyword set into one word-bounded alternation"""
+    alternation = "|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+    return re.compile(r"\b(?:" + alternation + r")\b")
+
+
+_GREETING_RE = _compile_keywords(GREETING_PATTERNS)
+_INFO_REQUEST_RE = _compile_keywords(INFO_REQUEST_PATTERNS)
+_MEMORY_RE = _compile_keywords(STRICT_MEMORY_PHRASES)
+_PRONOUN_RE = _compile_keywords(CONTEXT_PRONOUNS)
+
+# Union of every keyword set: most queries match none of them and can skip
+# the per-category checks after a single scan
+_ANY_KEYWORD_RE = _compile_keywords(
+    GREETING_PATTERNS + INFO_REQUEST_PATTERNS + STRICT_MEMORY_PHRASES + CONTEXT_PRONOUNS
+)
+
+_DEFAULT_ANALYSIS = MappingProxyType({
+    "intent": "normal_search",
+    "confidence": "high",
+    "indicators": (),
+    "reasoning": "No explicit memory indicators - treating as fresh information request"
+})
+
+
+def _norm(query: str) -> str:
+    """Strip and lowercase, skipping the lowercase copy when already lowercase"""
+    query = query.strip()
+    return query if query.islower() else query.lower()
+
+
+def analyze_memory_vs_retrieval_intent(query: str) -> Mapping:
+    """
+    ULTRA-STRICT analysis to prevent false memory detection
     
-    # Only check for memory if not a greeting or info request
-    memory_found = [phrase for phrase in strict_memory_phrases if phrase in query_lower]
-    if memory_found:
-        analysis["intent"] = "memory_priority"
-        analysis["indicators"] = memory_found
-        analysis["reasoning"] = f"Explicit memory request: {memory_found[0]}"
-        return analysis
+    Results are cached per normalised query and returned read-only, so
+    repeated questions (re-asks, personality switches) skip the scan.
+    """
+    return _analyze_cached(sys.intern(_norm(query)))
+
+
+# Classification table, checked in priority order: greetings and information
+# requests are never memory; memory phrases beat context pronouns
+_INTENT_RULES = (
+    (_GREETING_RE, "normal_search", "high", "Greeting detected - not a memory request"),
+    (_INFO_REQUEST_RE, "normal_search", "high", "Information request detected - not memory recall"),
+    (_MEMORY_RE, "memory_priority", "high", "Explicit memory request: {hits[0]}"),
+    (_PRONOUN_RE, "context_search", "medium", "Context pronouns detected: {hits}"),
+)
+
+
+@lru_cache(maxsize=1024)
+def _analyze_cached(query_lower: str) -> Mapping:
+    """Classify an already-normalised query"""
+    if not _ANY_KEYWORD_RE.search(query_lower):
+        return _DEFAULT_ANALYSIS
     
-    # Context pronouns (but not for simple questions)
-    context_pronouns = ["that one", "which one", "the other", "what about that"]
-    pronouns_found = [p for p in context_pronouns if p in query_lower]
-    if pronouns_found and not any(pattern in query_lower for pattern in info_request_patterns):
-        analysis["intent"] = "context_search"
-        analysis["confidence"] = "medium"
-        analysis["indicators"] = pronouns_found
-        analysis["reasoning"] = f"Context pronouns detected: {pronouns_found}"
-        return analysis
+    for pattern, intent, confidence, reasoning in _INTENT_RULES:
+        hits = pattern.findall(query_lower)
+        if hits:
+            return MappingProxyType({
+                "intent": intent,
+                "confidence": confidence,
+                "indicators": tuple(hits),
+                "reasoning": reasoning.format(hits=hits)
+            })
     
     # Default to normal search with high confidence
-    analysis["reasoning"] = "No explicit memory indicators - treating as fresh information request"
-    return analysis
-
-
-def test_controller_analysis():
-    """Test the FIXED memory analysis logic"""
-    test_cases = [
-        # Should be NORMAL_SEARCH
-        ("Hello, how are you?", "normal_search"),
-        ("What is Docker?", "normal_search"), 
-        ("How do I install Python?", "normal_search"),
-        ("Tell me about AI", "normal_search"),
-        ("Explain machine learning", "normal_search"),
-        ("What's the difference between X and Y?", "normal_search"),
-        
-        # Should be MEMORY_PRIORITY
-        ("remind me what we discussed about Docker", "memory_priority"),
-        ("what did we talk about earlier?", "memory_priority"),
-        ("summarize our conversation", "memory_priority"),
-        
-        # Should be CONTEXT_SEARCH
-        ("what about that other option", "context_search"),
-        ("how does that one compare", "context_search")
-    ]
-    
-    print("🧪 Testing FIXED Controller Analysis:")
-    print("=" * 50)
-    
-    correct = 0
-    total = len(test_cases)
-    
-    for query, expected in test_cases:
-        result = analyze_memory_vs_retrieval_intent(query)
-        actual = result['intent']
-        status = "✅" if actual == expected else "❌"
-        
-        print(f"{status} '{query}'")
-        print(f"   Expected: {expected} | Actual: {actual}")
-        print(f"   Reasoning: {result['reasoning']}")
-        
-        if actual == expected:
-            correct += 1
-        print()
-    
-    print(f"Accuracy: {correct}/{total} ({correct/total*100:.1f}%)")
-
-
-if __name__ == "__main__":
-    # test_controller_analysis()
-    pass  # Run tests if needed
\ No newline at end of file
+    return _DEFAULT_ANALYSIS
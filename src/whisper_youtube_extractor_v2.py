@@ -9,15 +9,197 @@ import os
 import re
 import json
 import time
+import queue
+import atexit
+import asyncio
+import hashlib
+import sqlite3
 import logging
-import whisper
+import logging.handlers
+import operator
+import threading
 import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 import yt_dlp
 
+# Prefer faster-whisper (CTranslate2, int8 weights): same models and JSON
+# output, a fraction of the memory. Falls back to the reference implementation.
+try:
+    import ctranslate2
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None
+    import whisper
+
+# Batched decoding of a video's chunks (faster-whisper 1.1+)
+try:
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:
+    BatchedInferencePipeline = None
+
+# orjson (Rust) serialises transcripts several times faster than json;
+# the files on disk look the same either way
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def write_json(json_file: Path, data: Dict):
+    """Write data as indented UTF-8 JSON"""
+    if orjson is not None:
+        json_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+def read_json(json_file: Path) -> Dict:
+    """Read a JSON file"""
+    if orjson is not None:
+        return orjson.loads(json_file.read_bytes())
+    with open(json_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+# PyArrow's CSV reader/writer is multi-threaded C++; pandas' own CSV code is
+# used when it isn't installed. It also writes the Parquet copy of each
+# combined CSV.
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Text columns of transcript CSVs, always read as strings: type inference
+# would turn upload dates ('20230101'), numeric-looking titles and video IDs
+# into numbers that no longer match freshly built rows
+CSV_STRING_COLUMNS = (
+    'text', 'video_id', 'video_title', 'video_url', 'personality', 'domain',
+    'uploader', 'upload_date', 'language', 'expertise_areas'
+)
+
+def read_csv_table(csv_file: Path, columns: Optional[List[str]] = None) -> 'pa.Table':
+    """Read a transcript CSV into an Arrow table (PyArrow only); text columns stay strings"""
+    convert_options = pacsv.ConvertOptions(
+        include_columns=columns,
+        column_types={column: pa.string() for column in CSV_STRING_COLUMNS}
+    )
+    return pacsv.read_csv(csv_file, convert_options=convert_options)
+
+def read_csv(csv_file: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read a transcript CSV (only the given columns, if any); text columns stay strings"""
+    if pa is not None:
+        return read_csv_table(csv_file, columns).to_pandas()
+    return pd.read_csv(csv_file, usecols=columns, dtype=dict.fromkeys(CSV_STRING_COLUMNS, str))
+
+# Write buffer for transcript CSVs: 1 MiB writes instead of 8 KiB ones
+# (flushed only when the file closes)
+CSV_BUFFER_SIZE = 1 << 20
+
+def write_csv(df: pd.DataFrame, csv_file: Path, append: bool = False):
+    """
+    Write a DataFrame as CSV, or append its rows (header only for a new file)
+    
+    The Arrow table is built before the file is opened, so a conversion error
+    leaves the file untouched. A full write goes to a temporary file that only
+    replaces the CSV once complete.
+    """
+    header = not (append and csv_file.exists())
+    table = pa.Table.from_pandas(df, preserve_index=False) if pa is not None else None
+    target = csv_file if append else csv_file.with_suffix('.csv.tmp')
+    
+    try:
+        if table is not None:
+            with open(target, 'ab' if append else 'wb', buffering=CSV_BUFFER_SIZE) as f:
+                pacsv.write_csv(table, f, write_options=pacsv.WriteOptions(include_header=header))
+        else:
+            with open(target, 'a' if append else 'w', newline='', encoding='utf-8',
+                      buffering=CSV_BUFFER_SIZE) as f:
+                df.to_csv(f, index=False, header=header)
+        if not append:
+            os.replace(target, csv_file)
+    finally:
+        if not append:
+            target.unlink(missing_ok=True)
+
+def write_parquet_copy(df: pd.DataFrame, csv_file: Path):
+    """
+    Write the zstd-compressed Parquet copy of a combined CSV (PyArrow only).
+    Repeated per-video columns are dictionary-encoded, so they cost little
+    beyond the segment text.
+    """
+    pq.write_table(
+        pa.Table.from_pandas(df, preserve_index=False),
+        csv_file.with_suffix('.parquet'), compression='zstd'
+    )
+
+def read_combined_table(combined_csv: Path, columns: Optional[List[str]] = None) -> 'pa.Table':
+    """
+    Read columns of a combined transcript store into an Arrow table (PyArrow
+    only), from its Parquet copy when that is up to date (columnar: unread
+    columns cost nothing) or else the CSV
+    """
+    parquet_file = combined_csv.with_suffix('.parquet')
+    if parquet_file.exists() and parquet_file.stat().st_mtime >= combined_csv.stat().st_mtime:
+        return pq.read_table(parquet_file, columns=columns)
+    return read_csv_table(combined_csv, columns)
+
+def read_combined(combined_csv: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read columns of a combined transcript store (Parquet copy or CSV) as a DataFrame"""
+    if pa is not None:
+        return read_combined_table(combined_csv, columns).to_pandas()
+    return read_csv(combined_csv, columns)
+
+def list_files(directory: Path, suffix: str, prefix: str = '') -> List[Path]:
+    """
+    List the files in a directory named prefix*suffix, in one os.scandir pass
+    (file types come from the directory listing, no stat per entry)
+    """
+    with os.scandir(directory) as entries:
+        return [
+            Path(entry.path) for entry in entries
+            if entry.name.startswith(prefix) and entry.name.endswith(suffix) and entry.is_file()
+        ]
+
+def count_files(directory: Path, suffix: str, prefix: str = '') -> int:
+    """Count the files list_files would return, without building their Paths"""
+    with os.scandir(directory) as entries:
+        return sum(
+            1 for entry in entries
+            if entry.name.startswith(prefix) and entry.name.endswith(suffix) and entry.is_file()
+        )
+
+def _compile_terms(terms: List[str]) -> re.Pattern:
+    """Compile substring terms into one alternation"""
+    return re.compile('|'.join(map(re.escape, terms)))
+
+# Title terms used when the channel gives no hint, checked in order
+TITLE_PATTERNS = [
+    ('bloomy', _compile_terms(['bloomberg', 'excel', 'finance', 'trading'])),
+    ('networkchuck', _compile_terms(['network', 'linux', 'vpn', 'cyber', 'docker', 'kubernetes']))
+]
+
+# Per-segment fields copied into CSV rows
+_SEGMENT_FIELDS = operator.itemgetter('start', 'end', 'text')
+
+# Downloaded audio containers (.wav from caches made before the re-encode was
+# dropped); anything else in the audio cache is a partial download
+AUDIO_EXTENSIONS = {'.m4a', '.webm', '.opus', '.ogg', '.mp3', '.wav'}
+
+def is_rate_limited(error: Exception) -> bool:
+    """Whether a yt-dlp error is YouTube throttling us (HTTP 429)"""
+    message = str(error)
+    return 'HTTP Error 429' in message or 'Too Many Requests' in message
+
+# watch?v=, youtu.be/, /embed/ and /v/ URLs in one scan
+VIDEO_ID_PATTERN = re.compile(r'(?:watch\?v=|youtu\.be/|youtube\.com/embed/|youtube\.com/v/)([a-zA-Z0-9_-]{11})')
+
 class ProcessingMode(Enum):
     """Processing mode options"""
     INCREMENTAL = "incremental"    # Skip existing, add new
@@ -32,6 +214,53 @@ class CacheConfig:
     VALIDATE_EXISTING = True  # Check JSON integrity
     CREATE_INDIVIDUAL_CSVS = False  # Only create combined CSVs
     ENABLE_DEDUPLICATION = True  # Remove duplicates
+    COMPUTE_TYPE = None  # faster-whisper precision (None: int8 on CPU, int8_float16 on GPU)
+    BATCH_SIZE = 8  # Audio chunks decoded together by faster-whisper (0: one at a time)
+    MAX_WORKERS = 4  # Videos downloading ahead of the one being transcribed
+    YOUTUBE_REQUESTS_PER_SECOND = 0  # yt-dlp sessions started per second (0: no limit until YouTube answers 429)
+
+class RateLimiter:
+    """
+    Token bucket shared by the download threads: up to `burst` calls go out
+    at once, then `rate` per second. Only YouTube requests take tokens, so
+    transcription never waits on it.
+    
+    The limit adapts to the server: each rate-limited response (HTTP 429)
+    halves the rate, starting from one call per second when unlimited.
+    """
+    
+    BACKOFF_RATE = 1.0  # Calls per second after the first 429 when unlimited
+    MIN_RATE = 1 / 60
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def backoff(self):
+        """Slow down after a rate-limited response"""
+        with self._lock:
+            self.rate = max(self.rate / 2, self.MIN_RATE) if self.rate else self.BACKOFF_RATE
+            self._tokens = min(self._tokens, 0)
+            self._updated = time.monotonic()
+    
+    def acquire(self):
+        """Block until a call may be made (returns at once when unlimited)"""
+        if not self.rate:
+            return
+        
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Take the token now; a negative balance is a reserved future slot
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        
+        if wait:
+            time.sleep(wait)
 
 class WhisperYouTubeExtractor:
     """
@@ -39,24 +268,40 @@ class WhisperYouTubeExtractor:
     Features: Smart caching, deduplication, cleanup, and validation
     """
     
-    def __init__(self, model_size: str = "base", cache_config: CacheConfig = None):
+    def __init__(self, model_size: str = "base", cache_config: CacheConfig = None,
+                 preload: bool = False):
         """
         Initialize the extractor
         
         Args:
             model_size: Whisper model size ('tiny', 'base', 'small', 'medium', 'large')
             cache_config: Cache configuration object
+            preload: Load the Whisper model in the background now, overlapping
+                the first downloads, instead of on the first transcription
         """
         self.model_size = model_size
         self.model = None  # Lazy load the model
+        self.batched_model = None
         self.cache_config = cache_config or CacheConfig()
+        self._combined_ids = {}  # personality -> video IDs in its combined CSV
+        self._deduplicated = set()  # Combined CSVs known to hold no duplicate rows
         
         # Create directory structure
         self.setup_directories()
         
+        # Index of transcript JSONs on disk, and parsed transcripts by video ID
+        self._json_paths = self.index_transcript_files()
+        self._json_cache = {}  # video_id -> (mtime_ns, transcript data)
+        
         # Setup logging
         self.setup_logging()
         
+        # Metadata cache for yt-dlp lookups
+        self.setup_video_info_cache()
+        
+        # Throttles YouTube requests across the download threads
+        self._youtube_limiter = RateLimiter(self.cache_config.YOUTUBE_REQUESTS_PER_SECOND)
+        
         # Personality mappings
         self.personality_mappings = {
             'networkchuck': {
@@ -71,6 +316,18 @@ class WhisperYouTubeExtractor:
             }
         }
         
+        self._channel_patterns = [
+            (personality, _compile_terms(mapping['channel_indicators']))
+            for personality, mapping in self.personality_mappings.items()
+        ]
+        
+        self._preload_thread = None
+        if preload:
+            self._preload_thread = threading.Thread(
+                target=self.load_whisper_model, name="whisper-preload", daemon=True
+            )
+            self._preload_thread.start()
+        
         print(f"🎤 Enhanced WhisperYouTubeExtractor initialized with model: {model_size}")
         print(f"📁 Cache config: Audio={self.cache_config.KEEP_AUDIO}, Individual CSVs={self.cache_config.CREATE_INDIVIDUAL_CSVS}")
     
@@ -100,39 +357,79 @@ class WhisperYouTubeExtractor:
             directory.mkdir(parents=True, exist_ok=True)
     
     def setup_logging(self):
-        """Setup logging configuration"""
-        log_file = self.logs_dir / f"extraction_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
-        )
+        """
+        Setup logging configuration
+        
+        Records go through a queue to a background listener thread that
+        writes the log file and the console, so the download and
+        transcription threads never wait on stream I/O.
+        """
+        if not logging.getLogger().handlers:
+            log_file = self.logs_dir / f"extraction_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+            
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            handlers = [logging.FileHandler(log_file), logging.StreamHandler()]
+            for handler in handlers:
+                handler.setFormatter(formatter)
+            
+            # The queued record carries just the message; the listener's
+            # handlers add the timestamp and level
+            log_queue = queue.SimpleQueue()
+            queue_handler = logging.handlers.QueueHandler(log_queue)
+            queue_handler.setFormatter(logging.Formatter('%(message)s'))
+            listener = logging.handlers.QueueListener(log_queue, *handlers)
+            logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+            listener.start()
+            atexit.register(listener.stop)  # Drains the queue before exit
+        
         self.logger = logging.getLogger(__name__)
     
+    def setup_video_info_cache(self):
+        """
+        Open the SQLite cache of video metadata, so re-runs skip yt-dlp's
+        metadata round trips. Shared by the download threads under a lock.
+        """
+        self._meta_lock = threading.Lock()
+        self._meta_db = sqlite3.connect(self.logs_dir / "video_info.sqlite", check_same_thread=False)
+        with self._meta_lock, self._meta_db:
+            self._meta_db.execute(
+                "CREATE TABLE IF NOT EXISTS video_info "
+                "(video_id TEXT PRIMARY KEY, info TEXT, fetched_at REAL)"
+            )
+            self._meta_db.execute(
+                "CREATE TABLE IF NOT EXISTS audio_hashes "
+                "(audio_hash TEXT PRIMARY KEY, video_id TEXT)"
+            )
+    
     def load_whisper_model(self):
-        """Lazy load Whisper model"""
+        """Lazy load Whisper model (waiting for a background preload to finish)"""
+        preload = self._preload_thread
+        if preload is not None and preload is not threading.current_thread():
+            preload.join()
+        
         if self.model is None:
             self.logger.info(f"🔄 Loading Whisper model: {self.model_size}")
-            self.model = whisper.load_model(self.model_size)
+            if WhisperModel is not None:
+                on_gpu = ctranslate2.get_cuda_device_count() > 0
+                compute_type = self.cache_config.COMPUTE_TYPE or ("int8_float16" if on_gpu else "int8")
+                self.model = WhisperModel(
+                    self.model_size,
+                    device="cuda" if on_gpu else "cpu",
+                    compute_type=compute_type,
+                    cpu_threads=os.cpu_count()
+                )
+                if BatchedInferencePipeline is not None and self.cache_config.BATCH_SIZE:
+                    self.batched_model = BatchedInferencePipeline(model=self.model)
+            else:
+                self.model = whisper.load_model(self.model_size)
             self.logger.info("✅ Whisper model loaded successfully")
         return self.model
     
     def extract_video_id(self, url: str) -> Optional[str]:
         """Extract video ID from YouTube URL"""
-        patterns = [
-            r'(?:watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})',
-            r'youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-            r'youtube\.com/v/([a-zA-Z0-9_-]{11})'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
+        match = VIDEO_ID_PATTERN.search(url)
+        if match:
+            return match.group(1)
         
         self.logger.error(f"Could not extract video ID from URL: {url}")
         return None
@@ -170,39 +467,61 @@ class WhisperYouTubeExtractor:
         else:
             return self.transcript_csv_dir
     
+    def index_transcript_files(self) -> Dict[str, Path]:
+        """
+        Map video IDs to their transcript JSON, listing each directory once
+        
+        Returns:
+            Dictionary of video ID to JSON path (earlier get_json_paths
+            directories win when a video has more than one file)
+        """
+        json_paths = {}
+        for json_dir in (self.transcript_cache_dir, self.bloomy_json_dir, self.nc_json_dir):
+            for path in list_files(json_dir, '.json'):
+                json_paths[path.stem] = path
+        return json_paths
+    
     def check_existing_transcript(self, video_id: str) -> Optional[Dict]:
         """
         Check if transcript already exists and return it
         
+        The JSON index replaces per-directory exists() checks, and a parsed
+        transcript is reused until its file's mtime changes.
+        
         Args:
             video_id: YouTube video ID
             
         Returns:
             Existing transcript data or None if not found
         """
-        possible_paths = self.get_json_paths(video_id)
+        path = self._json_paths.get(video_id)
+        if path is None:
+            return None
         
-        for path in possible_paths:
-            if path.exists():
-                try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    # Validate JSON structure if enabled
-                    if self.cache_config.VALIDATE_EXISTING:
-                        if self.validate_transcript_json(data):
-                            self.logger.info(f"📋 Using cached transcript: {video_id}")
-                            return data
-                        else:
-                            self.logger.warning(f"⚠️ Invalid cached transcript, will reprocess: {video_id}")
-                            path.unlink()  # Delete invalid file
-                    else:
-                        self.logger.info(f"📋 Using cached transcript: {video_id}")
-                        return data
-                        
-                except Exception as e:
-                    self.logger.warning(f"Error reading cached transcript {path}: {e}")
-                    continue
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+            cached = self._json_cache.get(video_id)
+            if cached and cached[0] == mtime_ns:
+                self.logger.info(f"📋 Using cached transcript: {video_id}")
+                return cached[1]
+            
+            data = read_json(path)
+            
+            # Validate JSON structure if enabled
+            if self.cache_config.VALIDATE_EXISTING and not self.validate_transcript_json(data):
+                self.logger.warning(f"⚠️ Invalid cached transcript, will reprocess: {video_id}")
+                path.unlink()  # Delete invalid file
+                del self._json_paths[video_id]
+                return None
+            
+            self._json_cache[video_id] = (mtime_ns, data)
+            self.logger.info(f"📋 Using cached transcript: {video_id}")
+            return data
+            
+        except FileNotFoundError:
+            self._json_paths.pop(video_id, None)
+        except Exception as e:
+            self.logger.warning(f"Error reading cached transcript {path}: {e}")
         
         return None
     
@@ -244,21 +563,48 @@ class WhisperYouTubeExtractor:
     def cleanup_old_audio(self):
         """Remove old audio files based on age"""
         if not self.cache_config.KEEP_AUDIO and self.cache_config.MAX_AUDIO_AGE_DAYS > 0:
-            cutoff_date = datetime.now() - timedelta(days=self.cache_config.MAX_AUDIO_AGE_DAYS)
+            # Compared against raw st_mtime floats, no datetime per file
+            cutoff_ts = (datetime.now() - timedelta(days=self.cache_config.MAX_AUDIO_AGE_DAYS)).timestamp()
             
             removed_count = 0
-            for audio_file in self.audio_cache_dir.glob("*.wav"):
-                try:
-                    file_time = datetime.fromtimestamp(audio_file.stat().st_mtime)
-                    if file_time < cutoff_date:
-                        audio_file.unlink()
-                        removed_count += 1
-                except Exception as e:
-                    self.logger.warning(f"Error removing old audio file {audio_file}: {e}")
+            with os.scandir(self.audio_cache_dir) as entries:
+                for entry in entries:
+                    if os.path.splitext(entry.name)[1] not in AUDIO_EXTENSIONS:
+                        continue
+                    try:
+                        if entry.is_file() and entry.stat().st_mtime < cutoff_ts:
+                            os.unlink(entry.path)
+                            removed_count += 1
+                    except OSError as e:
+                        self.logger.warning(f"Error removing old audio file {entry.path}: {e}")
             
             if removed_count > 0:
                 self.logger.info(f"🧹 Cleaned up {removed_count} old audio files")
     
+    def list_audio_files(self) -> List[Path]:
+        """Downloaded audio files in the audio cache, whatever their container"""
+        return [f for f in list_files(self.audio_cache_dir, '') if f.suffix in AUDIO_EXTENSIONS]
+    
+    def audio_cache_usage(self) -> Tuple[int, int]:
+        """
+        Number and total size in bytes of the cached audio files, from one
+        os.scandir pass (no Path per file, stat results come with the entries)
+        """
+        count = total_bytes = 0
+        with os.scandir(self.audio_cache_dir) as entries:
+            for entry in entries:
+                if os.path.splitext(entry.name)[1] in AUDIO_EXTENSIONS and entry.is_file():
+                    count += 1
+                    total_bytes += entry.stat().st_size
+        return count, total_bytes
+    
+    def find_cached_audio(self, video_id: str) -> Optional[Path]:
+        """Find the downloaded audio for a video, whatever container it came in"""
+        for audio_file in self.audio_cache_dir.glob(f"{video_id}.*"):
+            if audio_file.suffix in AUDIO_EXTENSIONS:
+                return audio_file
+        return None
+    
     def detect_personality(self, video_info: Dict, video_url: str) -> str:
         """Detect personality based on video info and URL"""
         # Check uploader/channel name
@@ -266,97 +612,174 @@ class WhisperYouTubeExtractor:
         title = video_info.get('title', '').lower()
         channel = video_info.get('channel', '').lower()
         
-        # NetworkChuck detection
-        nc_indicators = self.personality_mappings['networkchuck']['channel_indicators']
-        if any(indicator in uploader for indicator in nc_indicators) or \
-           any(indicator in channel for indicator in nc_indicators):
-            return 'networkchuck'
-        
-        # Bloomy detection  
-        bloomy_indicators = self.personality_mappings['bloomy']['channel_indicators']
-        if any(indicator in uploader for indicator in bloomy_indicators) or \
-           any(indicator in channel for indicator in bloomy_indicators):
-            return 'bloomy'
+        # Channel detection (NetworkChuck first, then Bloomy), one scan per
+        # personality over uploader and channel together
+        channel_names = f"{uploader}\n{channel}"
+        for personality, pattern in self._channel_patterns:
+            if pattern.search(channel_names):
+                return personality
         
         # Fallback: detect by common terms in title
-        if any(term in title for term in ['bloomberg', 'excel', 'finance', 'trading']):
-            return 'bloomy'
-        elif any(term in title for term in ['network', 'linux', 'vpn', 'cyber', 'docker', 'kubernetes']):
-            return 'networkchuck'
+        for personality, pattern in TITLE_PATTERNS:
+            if pattern.search(title):
+                return personality
         
         # Default fallback based on content
         self.logger.warning(f"Could not detect personality for: {uploader} - {title}")
         return 'unknown'
     
-    def get_video_info(self, url: str) -> Dict:
-        """Get video metadata using yt-dlp"""
+    def get_video_info(self, url: str, video_id: Optional[str] = None) -> Dict:
+        """
+        Get video metadata using yt-dlp
+        
+        Args:
+            url: Video URL
+            video_id: Video ID; when given, metadata is read from and saved to
+                the video info cache
+            
+        Returns:
+            Video metadata dictionary
+        """
+        if video_id:
+            cached = self.load_cached_video_info(video_id)
+            if cached:
+                return cached
+        
         ydl_opts = {
             'quiet': True,
             'no_warnings': True,
         }
         
         try:
+            self._youtube_limiter.acquire()
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
-                
-                return {
-                    'title': info.get('title', 'Unknown'),
-                    'uploader': info.get('uploader', 'Unknown'),
-                    'channel': info.get('channel', 'Unknown'),
-                    'duration': info.get('duration', 0),
-                    'upload_date': info.get('upload_date', 'Unknown'),
-                    'view_count': info.get('view_count', 0),
-                    'description': info.get('description', ''),
-                    'tags': info.get('tags', [])
-                }
+            
+            video_info = self.build_video_info(info)
+            if video_id:
+                self.save_video_info(video_id, video_info)
+            return video_info
         except Exception as e:
+            self.check_rate_limit(e)
             self.logger.error(f"Error getting video info: {e}")
-            return {
-                'title': 'Unknown',
-                'uploader': 'Unknown',
-                'channel': 'Unknown',
-                'duration': 0,
-                'upload_date': 'Unknown',
-                'view_count': 0,
-                'description': '',
-                'tags': []
-            }
+            return self.build_video_info({})
+    
+    def check_rate_limit(self, error: Exception):
+        """Slow down YouTube requests if a yt-dlp error was a rate-limit response"""
+        if is_rate_limited(error):
+            self._youtube_limiter.backoff()
+            self.logger.warning(f"⏳ YouTube is rate limiting, slowing to {self._youtube_limiter.rate:g} requests/s")
+    
+    @staticmethod
+    def build_video_info(info: Dict) -> Dict:
+        """Pick the metadata fields kept from a yt-dlp info dict (defaults when missing)"""
+        return {
+            'title': info.get('title', 'Unknown'),
+            'uploader': info.get('uploader', 'Unknown'),
+            'channel': info.get('channel', 'Unknown'),
+            'duration': info.get('duration', 0),
+            'upload_date': info.get('upload_date', 'Unknown'),
+            'view_count': info.get('view_count', 0),
+            'description': info.get('description', ''),
+            'tags': info.get('tags', [])
+        }
+    
+    def load_cached_video_info(self, video_id: str) -> Optional[Dict]:
+        """Read a video's metadata from the video info cache"""
+        with self._meta_lock:
+            row = self._meta_db.execute(
+                "SELECT info FROM video_info WHERE video_id = ?", (video_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def save_video_info(self, video_id: str, video_info: Dict):
+        """Store a successful metadata lookup (failures are retried next run)"""
+        with self._meta_lock, self._meta_db:
+            self._meta_db.execute(
+                "INSERT OR REPLACE INTO video_info VALUES (?, ?, ?)",
+                (video_id, json.dumps(video_info, ensure_ascii=False), time.time())
+            )
+    
+    @staticmethod
+    def hash_audio(audio_path: Path) -> str:
+        """Content hash of a downloaded audio file (streamed, 1 MiB at a time)"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(audio_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def find_transcript_by_audio(self, audio_hash: str, video_id: str) -> Optional[Dict]:
+        """Cached transcript of another video whose audio file is identical, if any"""
+        with self._meta_lock:
+            row = self._meta_db.execute(
+                "SELECT video_id FROM audio_hashes WHERE audio_hash = ?", (audio_hash,)
+            ).fetchone()
+        if row and row[0] != video_id:
+            return self.check_existing_transcript(row[0])
+        return None
+    
+    def record_audio_hash(self, audio_hash: str, video_id: str):
+        """Remember which video a transcribed audio file belongs to"""
+        with self._meta_lock, self._meta_db:
+            self._meta_db.execute(
+                "INSERT OR REPLACE INTO audio_hashes VALUES (?, ?)", (audio_hash, video_id)
+            )
     
     def download_audio(self, url: str, video_id: str) -> Optional[Path]:
         """Download audio from YouTube video"""
-        audio_file = self.audio_cache_dir / f"{video_id}.wav"
+        return self.fetch_audio_and_info(url, video_id)[0]
+    
+    def fetch_audio_and_info(self, url: str, video_id: str) -> Tuple[Optional[Path], Dict]:
+        """
+        Download a video's audio and metadata in one yt-dlp session
+        
+        extract_info(download=True) returns the same metadata a separate
+        get_video_info call would request again, so a new video costs one
+        round of YouTube requests instead of two.
         
+        Args:
+            url: Video URL
+            video_id: Video ID
+            
+        Returns:
+            (audio path or None if the download failed, video metadata)
+        """
         # Check if already downloaded
-        if audio_file.exists():
+        audio_file = self.find_cached_audio(video_id)
+        if audio_file:
             self.logger.info(f"Audio already cached: {video_id}")
-            return audio_file
+            return audio_file, self.get_video_info(url, video_id)
         
         ydl_opts = {
-            'format': 'bestaudio/best',
+            # Native audio stream, no WAV transcode: Whisper decodes and
+            # resamples any ffmpeg-readable container itself
+            'format': 'bestaudio[ext=m4a]/bestaudio',
             'outtmpl': str(self.audio_cache_dir / f"{video_id}.%(ext)s"),
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'wav',
-                'preferredquality': '192',
-            }],
             'quiet': True,
             'no_warnings': True,
         }
         
         try:
+            self._youtube_limiter.acquire()
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
+                info = ydl.extract_info(url, download=True)
+                audio_file = Path(ydl.prepare_filename(info))
+            
+            video_info = self.build_video_info(info)
+            self.save_video_info(video_id, video_info)
             
             if audio_file.exists():
                 self.logger.info(f"✅ Audio downloaded: {video_id}")
-                return audio_file
+                return audio_file, video_info
             else:
                 self.logger.error(f"Audio file not found after download: {video_id}")
-                return None
+                return None, video_info
                 
         except Exception as e:
+            self.check_rate_limit(e)
             self.logger.error(f"Error downloading audio for {video_id}: {e}")
-            return None
+            return None, self.build_video_info({})
     
     def transcribe_audio(self, audio_path: Path, video_id: str) -> Optional[Dict]:
         """Transcribe audio using Whisper"""
@@ -364,7 +787,23 @@ class WhisperYouTubeExtractor:
             model = self.load_whisper_model()
             
             self.logger.info(f"🎤 Transcribing audio: {video_id}")
-            result = model.transcribe(str(audio_path))
+            if WhisperModel is not None:
+                # Greedy decoding, as openai-whisper's transcribe() defaults to;
+                # Silero VAD drops silent stretches before they reach the encoder
+                options = dict(
+                    beam_size=1, word_timestamps=False,
+                    vad_filter=True, vad_parameters=dict(min_silence_duration_ms=500)
+                )
+                if self.batched_model is not None:
+                    # Speech chunks go through the encoder and decoder in batches
+                    segments, info = self.batched_model.transcribe(
+                        str(audio_path), batch_size=self.cache_config.BATCH_SIZE, **options
+                    )
+                else:
+                    segments, info = model.transcribe(str(audio_path), **options)
+                result = self._faster_whisper_result(segments, info)
+            else:
+                result = model.transcribe(str(audio_path))
             
             self.logger.info(f"✅ Transcription complete: {video_id}")
             return result
@@ -373,6 +812,19 @@ class WhisperYouTubeExtractor:
             self.logger.error(f"Error transcribing audio for {video_id}: {e}")
             return None
     
+    @staticmethod
+    def _faster_whisper_result(segments, info) -> Dict:
+        """Normalise faster-whisper output to the openai-whisper result dict"""
+        segments = [
+            {'id': segment.id, 'start': segment.start, 'end': segment.end, 'text': segment.text}
+            for segment in segments  # Generator: decoding happens here
+        ]
+        return {
+            'language': info.language,
+            'text': ''.join(segment['text'] for segment in segments),
+            'segments': segments
+        }
+    
     def create_comprehensive_transcript_data(self, video_id: str, video_url: str, 
                                            video_info: Dict, whisper_result: Dict) -> Dict:
         """Create comprehensive transcript data structure"""
@@ -406,58 +858,69 @@ class WhisperYouTubeExtractor:
         json_file = json_dir / f"{video_id}.json"
         
         try:
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(transcript_data, f, indent=2, ensure_ascii=False)
+            write_json(json_file, transcript_data)
+            self._json_paths[video_id] = json_file
             self.logger.info(f"💾 JSON saved: {json_file}")
         except Exception as e:
             self.logger.error(f"Error saving JSON for {video_id}: {e}")
     
-    def create_csv_data(self, transcript_data: Dict) -> List[Dict]:
-        """Create CSV data from transcript"""
-        video_id = transcript_data['video_id']
-        personality = transcript_data.get('personality', 'unknown')
-        domain = transcript_data.get('domain', 'unknown')
+    def create_csv_data(self, transcript_data: Dict) -> pd.DataFrame:
+        """
+        Create CSV data from transcript, one row per segment
+        
+        Built column by column: the per-segment values are gathered into lists
+        and the per-video fields are passed as scalars, which pandas broadcasts
+        to every row without building a dict per segment.
+        """
         segments = transcript_data.get('segments', [])
+        if not segments:
+            return pd.DataFrame()
         
-        csv_data = []
-        for i, segment in enumerate(segments):
-            segment_data = {
-                'segment_id': i,
-                'start_time': segment.get('start', 0),
-                'end_time': segment.get('end', 0),
-                'duration': segment.get('end', 0) - segment.get('start', 0),
-                'text': segment.get('text', '').strip(),
-                'video_id': video_id,
-                'video_title': transcript_data['video_info']['title'],
-                'video_url': transcript_data['video_url'],
-                'personality': personality,
-                'domain': domain,
-                'uploader': transcript_data['video_info']['uploader'],
-                'upload_date': transcript_data['video_info']['upload_date'],
-                'language': transcript_data.get('language', 'unknown'),
-                'video_duration': transcript_data['video_info'].get('duration', 0),
-                'expertise_areas': ','.join(transcript_data.get('expertise_areas', []))
-            }
-            csv_data.append(segment_data)
+        video_info = transcript_data['video_info']
         
-        return csv_data
+        # Whisper always emits start/end/text, so the three columns come out of
+        # one C-level itemgetter pass; .get() defaults only for odd segments
+        try:
+            starts, ends, texts = zip(*map(_SEGMENT_FIELDS, segments))
+        except KeyError:
+            starts, ends, texts = zip(*(
+                (segment.get('start', 0), segment.get('end', 0), segment.get('text', ''))
+                for segment in segments
+            ))
+        
+        return pd.DataFrame({
+            'segment_id': range(len(segments)),
+            'start_time': starts,
+            'end_time': ends,
+            'duration': [end - start for start, end in zip(starts, ends)],
+            'text': [text.strip() for text in texts],
+            'video_id': transcript_data['video_id'],
+            'video_title': video_info['title'],
+            'video_url': transcript_data['video_url'],
+            'personality': transcript_data.get('personality', 'unknown'),
+            'domain': transcript_data.get('domain', 'unknown'),
+            'uploader': video_info['uploader'],
+            'upload_date': video_info['upload_date'],
+            'language': transcript_data.get('language', 'unknown'),
+            'video_duration': video_info.get('duration', 0),
+            'expertise_areas': ','.join(transcript_data.get('expertise_areas', []))
+        })
     
     def save_individual_csv(self, transcript_data: Dict, video_id: str, personality: str):
         """Save individual CSV file for a video (if enabled)"""
         if not self.cache_config.CREATE_INDIVIDUAL_CSVS:
             return
             
-        csv_data = self.create_csv_data(transcript_data)
+        df = self.create_csv_data(transcript_data)
         
-        if not csv_data:
+        if df.empty:
             return
         
         csv_dir = self.get_csv_dir(personality)
         csv_file = csv_dir / f"transcript_{video_id}.csv"
         
         try:
-            df = pd.DataFrame(csv_data)
-            df.to_csv(csv_file, index=False, encoding='utf-8')
+            write_csv(df, csv_file)
             self.logger.info(f"📊 Individual CSV saved: {csv_file}")
         except Exception as e:
             self.logger.error(f"Error saving individual CSV for {video_id}: {e}")
@@ -477,76 +940,106 @@ class WhisperYouTubeExtractor:
         combined_csv = csv_dir / f"all_{personality}_transcripts.csv"
         
         # Get new segments
-        new_segments = self.create_csv_data(transcript_data)
-        if not new_segments:
+        new_df = self.create_csv_data(transcript_data)
+        if new_df.empty:
             return
         
+        video_id = transcript_data['video_id']
+        
         try:
-            # Load existing CSV or create new DataFrame
-            if combined_csv.exists():
-                existing_df = pd.read_csv(combined_csv)
-                
-                # Remove old entries for this video_id if they exist
-                video_id = transcript_data['video_id']
+            combined_ids = self.get_combined_video_ids(personality, combined_csv)
+            
+            if video_id in combined_ids:
+                # Reprocessed video: rewrite the CSV without its old entries
+                existing_df = read_csv(combined_csv)
                 existing_df = existing_df[existing_df['video_id'] != video_id]
-                
-                # Add new segments
-                new_df = pd.DataFrame(new_segments)
+                # Match the stored column types (e.g. float durations), so the
+                # concat doesn't fall back to mixed object columns
+                new_df = new_df.astype({
+                    column: dtype for column, dtype in existing_df.dtypes.items()
+                    if column in new_df and new_df[column].dtype != dtype
+                })
                 combined_df = pd.concat([existing_df, new_df], ignore_index=True)
+                write_csv(combined_df, combined_csv)
             else:
-                # Create new CSV
-                combined_df = pd.DataFrame(new_segments)
+                # New video: append its rows (header only when creating the file)
+                write_csv(new_df, combined_csv, append=True)
+                combined_ids.add(video_id)
             
-            # Save updated CSV
-            combined_df.to_csv(combined_csv, index=False, encoding='utf-8')
             self.logger.info(f"📈 Updated combined CSV: {combined_csv}")
             
         except Exception as e:
             self.logger.error(f"Error updating combined CSV for {personality}: {e}")
     
-    def deduplicate_csv(self, csv_file: Path):
+    def get_combined_video_ids(self, personality: str, combined_csv: Path) -> set:
+        """
+        Video IDs present in a personality's combined CSV
+        
+        Read once (video_id column only) and then kept up to date as rows are
+        appended, so incremental updates don't re-read the whole file.
+        """
+        if personality not in self._combined_ids:
+            if combined_csv.exists():
+                df = read_combined(combined_csv, columns=['video_id'])
+                self._combined_ids[personality] = set(df['video_id'])
+            else:
+                self._combined_ids[personality] = set()
+        return self._combined_ids[personality]
+    
+    def deduplicate_csv(self, csv_file: Path, force: bool = False):
         """
         Remove duplicate entries from CSV based on video_id + segment_id
         
+        Files this extractor rebuilt or deduplicated are skipped: appends
+        only ever add video IDs the file doesn't hold yet, so they stay clean.
+        
         Args:
             csv_file: Path to CSV file
+            force: Check the file even if it is known to be clean
         """
         if not csv_file.exists():
             return
+        if csv_file in self._deduplicated and not force:
+            return
         
         try:
-            df = pd.read_csv(csv_file)
-            original_count = len(df)
+            df = read_csv(csv_file)
             
             # Remove duplicates keeping the last occurrence
-            df_clean = df.drop_duplicates(subset=['video_id', 'segment_id'], keep='last')
+            duplicated = df.duplicated(subset=['video_id', 'segment_id'], keep='last')
             
-            duplicates_removed = original_count - len(df_clean)
+            duplicates_removed = int(duplicated.sum())
             if duplicates_removed > 0:
-                df_clean.to_csv(csv_file, index=False, encoding='utf-8')
+                df = df[~duplicated]
+                write_csv(df, csv_file)
+                # Keep an existing Parquet copy current, or reads fall back to the CSV
+                if pa is not None and csv_file.with_suffix('.parquet').exists():
+                    write_parquet_copy(df, csv_file)
                 self.logger.info(f"🧹 Removed {duplicates_removed} duplicates from {csv_file}")
+            self._deduplicated.add(csv_file)
             
         except Exception as e:
             self.logger.error(f"Error deduplicating CSV {csv_file}: {e}")
     
-    def cleanup_orphaned_files(self, personality: str):
+    def cleanup_orphaned_files(self, personality: str, json_ids: Optional[set] = None):
         """
         Remove individual CSVs for videos no longer in JSON cache
         
         Args:
             personality: Video personality
+            json_ids: Video IDs with JSON files, if already listed
         """
         if not self.cache_config.CREATE_INDIVIDUAL_CSVS:
             return
         
-        json_dir = self.get_json_dir(personality)
         csv_dir = self.get_csv_dir(personality)
         
         # Get list of video IDs that have JSON files
-        json_ids = {f.stem for f in json_dir.glob("*.json")}
+        if json_ids is None:
+            json_ids = {f.stem for f in list_files(self.get_json_dir(personality), '.json')}
         
         # Check individual CSV files
-        csv_files = csv_dir.glob("transcript_*.csv")
+        csv_files = list_files(csv_dir, '.csv', prefix='transcript_')
         removed_count = 0
         
         for csv_file in csv_files:
@@ -561,42 +1054,66 @@ class WhisperYouTubeExtractor:
         if removed_count > 0:
             self.logger.info(f"🧹 Removed {removed_count} orphaned CSV files for {personality}")
     
-    def create_combined_csv(self, personality: str):
-        """Create combined CSV for a specific personality from all JSON files"""
+    def create_combined_csv(self, personality: str) -> Optional[set]:
+        """
+        Create combined CSV for a specific personality from all JSON files
+        
+        Returns:
+            Video IDs of the JSON files found (None if they couldn't be listed)
+        """
         if personality not in ['networkchuck', 'bloomy']:
-            return
+            return None
         
         json_dir = self.get_json_dir(personality)
         csv_dir = self.get_csv_dir(personality)
         csv_file = csv_dir / f"all_{personality}_transcripts.csv"
         
+        # The CSV is rebuilt from scratch; re-read its video IDs on next update
+        self._combined_ids.pop(personality, None)
+        self._deduplicated.discard(csv_file)
+        json_ids = None
+        
         try:
             all_segments = []
             
+            # Segments are unique within a transcript, so duplicates can only
+            # come from two files holding the same video: keep the first one
+            seen_ids = set()
+            duplicates_removed = 0
+            
             # Process all JSON files for this personality
-            for json_file in json_dir.glob("*.json"):
+            json_files = list_files(json_dir, '.json')
+            json_ids = {f.stem for f in json_files}
+            for json_file in json_files:
                 try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        transcript_data = json.load(f)
+                    transcript_data = read_json(json_file)
                     
-                    csv_data = self.create_csv_data(transcript_data)
-                    all_segments.extend(csv_data)
+                    video_id = transcript_data.get('video_id')
+                    if self.cache_config.ENABLE_DEDUPLICATION and video_id in seen_ids:
+                        duplicates_removed += len(transcript_data.get('segments', []))
+                        continue
+                    seen_ids.add(video_id)
+                    
+                    df = self.create_csv_data(transcript_data)
+                    if not df.empty:
+                        all_segments.append(df)
                     
                 except Exception as e:
                     self.logger.error(f"Error processing {json_file}: {e}")
             
             if all_segments:
-                df = pd.DataFrame(all_segments)
+                df = pd.concat(all_segments, ignore_index=True)
+                
+                if duplicates_removed > 0:
+                    self.logger.info(f"🧹 Removed {duplicates_removed} duplicates during CSV creation")
                 
-                # Deduplicate if enabled
+                write_csv(df, csv_file)
                 if self.cache_config.ENABLE_DEDUPLICATION:
-                    original_count = len(df)
-                    df = df.drop_duplicates(subset=['video_id', 'segment_id'], keep='last')
-                    duplicates_removed = original_count - len(df)
-                    if duplicates_removed > 0:
-                        self.logger.info(f"🧹 Removed {duplicates_removed} duplicates during CSV creation")
+                    self._deduplicated.add(csv_file)
                 
-                df.to_csv(csv_file, index=False, encoding='utf-8')
+                # Zstd-compressed Parquet copy for column reads (stats, validation)
+                if pa is not None:
+                    write_parquet_copy(df, csv_file)
                 self.logger.info(f"✅ Combined {personality} CSV created: {csv_file}")
                 self.logger.info(f"📊 Total {personality} segments: {len(df)}")
             else:
@@ -604,6 +1121,29 @@ class WhisperYouTubeExtractor:
                 
         except Exception as e:
             self.logger.error(f"Failed to create combined {personality} CSV: {e}")
+        
+        return json_ids
+    
+    def rebuild_personality(self, personality: str):
+        """
+        Rebuild a personality's combined CSV, deduplicate it and remove its
+        orphaned individual CSVs
+        
+        The JSON directory is listed once for the rebuild and the orphan
+        check, and the freshly rebuilt CSV needs no second dedup pass.
+        
+        Args:
+            personality: Video personality
+        """
+        json_ids = self.create_combined_csv(personality)
+        
+        # Deduplicate if enabled (a no-op when the rebuild succeeded)
+        if self.cache_config.ENABLE_DEDUPLICATION:
+            csv_dir = self.get_csv_dir(personality)
+            self.deduplicate_csv(csv_dir / f"all_{personality}_transcripts.csv")
+        
+        # Cleanup orphaned files
+        self.cleanup_orphaned_files(personality, json_ids)
     
     def validate_data_integrity(self):
         """Check JSON-CSV consistency and report issues"""
@@ -622,10 +1162,11 @@ class WhisperYouTubeExtractor:
                 continue
             
             # Check JSON files vs CSV entries
-            json_ids = {f.stem for f in json_dir.glob("*.json")}
+            json_ids = {f.stem for f in list_files(json_dir, '.json')}
             
             try:
-                df = pd.read_csv(combined_csv)
+                # Only the video_id column is read, not the segment text
+                df = read_combined(combined_csv, columns=['video_id'])
                 csv_ids = set(df['video_id'].unique())
                 
                 # Find discrepancies
@@ -661,6 +1202,29 @@ class WhisperYouTubeExtractor:
         Returns:
             Processed transcript data or None if failed
         """
+        prepared = self._prepare(video_data, mode)
+        if not prepared:
+            return None
+        if 'transcript_data' in prepared:
+            return prepared['transcript_data']
+        
+        transcript_data = self._transcribe_and_save(video_data, prepared)
+        self._remove_audio(prepared)
+        return transcript_data
+    
+    def _prepare(self, video_data: Dict, mode: ProcessingMode = ProcessingMode.INCREMENTAL) -> Optional[Dict]:
+        """
+        Network stage: resolve the video, reuse a cached transcript or fetch
+        metadata and download audio
+        
+        Args:
+            video_data: Dictionary containing 'url' and optional metadata
+            mode: Processing mode
+            
+        Returns:
+            Dictionary with video_id, clean_url, video_info and audio_path (or just
+            video_id and transcript_data when a cached transcript is used), or None if failed
+        """
         url = video_data.get('url', '')
         clean_url = self.clean_video_url(url)
         video_id = self.extract_video_id(clean_url)
@@ -673,38 +1237,101 @@ class WhisperYouTubeExtractor:
         if mode == ProcessingMode.INCREMENTAL:
             existing_transcript = self.check_existing_transcript(video_id)
             if existing_transcript:
-                return existing_transcript
+                return {'video_id': video_id, 'transcript_data': existing_transcript}
         
         try:
             self.logger.info(f"🎬 Processing video: {video_id}")
             start_time = time.time()
             
-            # Get video info
-            video_info = self.get_video_info(clean_url)
-            
-            # Download audio
-            audio_path = self.download_audio(clean_url, video_id)
+            # Download audio, getting video info from the same yt-dlp session
+            audio_path, video_info = self.fetch_audio_and_info(clean_url, video_id)
             if not audio_path:
                 raise Exception("Failed to download audio")
             
-            # Transcribe audio
-            whisper_result = self.transcribe_audio(audio_path, video_id)
+            # The same audio under another video ID (re-upload, URL variant)
+            # can reuse that video's transcript instead of running Whisper
+            audio_hash = self.hash_audio(audio_path)
+            reused_transcript = None
+            if mode == ProcessingMode.INCREMENTAL:
+                reused_transcript = self.find_transcript_by_audio(audio_hash, video_id)
+            
+            return {
+                'video_id': video_id,
+                'clean_url': clean_url,
+                'video_info': video_info,
+                'audio_path': audio_path,
+                'audio_hash': audio_hash,
+                'reused_transcript': reused_transcript,
+                'started_at': start_time
+            }
+            
+        except Exception as e:
+            self.logger.error(f"❌ Failed to process {video_id}: {e}")
+            return None
+    
+    def _transcribe_and_save(self, video_data: Dict, prepared: Dict,
+                             writer: Optional[ThreadPoolExecutor] = None) -> Optional[Dict]:
+        """
+        Compute stage: transcribe downloaded audio and save the transcript files
+        
+        Args:
+            video_data: Original video dictionary
+            prepared: Result of _prepare
+            writer: Executor to save the files on in the background (saved
+                before returning when None)
+            
+        Returns:
+            Processed transcript data or None if failed
+        """
+        video_id = prepared['video_id']
+        
+        try:
+            # Transcribe audio (unless identical audio was transcribed before)
+            whisper_result = prepared.get('reused_transcript')
+            if whisper_result:
+                self.logger.info(f"♻️ Same audio as {whisper_result['video_id']}, reusing its transcript: {video_id}")
+            else:
+                whisper_result = self.transcribe_audio(prepared['audio_path'], video_id)
             if not whisper_result:
                 raise Exception("Failed to transcribe audio")
             
             # Create comprehensive transcript data
             transcript_data = self.create_comprehensive_transcript_data(
-                video_id, clean_url, video_info, whisper_result
+                video_id, prepared['clean_url'], prepared['video_info'], whisper_result
             )
             
             # Add original metadata from video_data
             transcript_data['source_metadata'] = video_data
             
-            # Detect personality for file organization
-            personality = transcript_data['personality']
+            if writer is not None:
+                writer.submit(self._save_transcript_files, transcript_data, prepared['audio_hash'])
+            else:
+                self._save_transcript_files(transcript_data, prepared['audio_hash'])
+            
+            processing_time = time.time() - prepared['started_at']
+            self.logger.info(f"✅ Completed {video_id} ({transcript_data['personality']}) in {processing_time:.1f}s")
+            
+            return transcript_data
             
+        except Exception as e:
+            self.logger.error(f"❌ Failed to process {video_id}: {e}")
+            return None
+    
+    def _save_transcript_files(self, transcript_data: Dict, audio_hash: str):
+        """
+        Write stage: save the JSON, individual CSV and combined CSV rows of a
+        transcript (errors are logged, not raised, as this may run in the
+        background)
+        """
+        video_id = transcript_data['video_id']
+        
+        # Detect personality for file organization
+        personality = transcript_data['personality']
+        
+        try:
             # Save JSON file
             self.save_transcript_json(transcript_data, video_id, personality)
+            self.record_audio_hash(audio_hash, video_id)
             
             # Save individual CSV (if enabled)
             self.save_individual_csv(transcript_data, video_id, personality)
@@ -712,27 +1339,30 @@ class WhisperYouTubeExtractor:
             # Update combined CSV incrementally
             self.update_combined_csv_incrementally(transcript_data, personality)
             
-            # Clean up audio file if configured
-            if not self.cache_config.KEEP_AUDIO:
-                try:
-                    audio_path.unlink()
-                    self.logger.info(f"🧹 Removed audio file: {video_id}")
-                except Exception as e:
-                    self.logger.warning(f"Could not remove audio file: {e}")
-            
-            processing_time = time.time() - start_time
-            self.logger.info(f"✅ Completed {video_id} ({personality}) in {processing_time:.1f}s")
-            
-            return transcript_data
-            
         except Exception as e:
-            self.logger.error(f"❌ Failed to process {video_id}: {e}")
-            return None
+            self.logger.error(f"❌ Failed to save transcript files for {video_id}: {e}")
+    
+    def _remove_audio(self, prepared: Dict):
+        """Clean up a downloaded audio file if configured"""
+        if self.cache_config.KEEP_AUDIO:
+            return
+        
+        try:
+            prepared['audio_path'].unlink()
+            self.logger.info(f"🧹 Removed audio file: {prepared['video_id']}")
+        except Exception as e:
+            self.logger.warning(f"Could not remove audio file: {e}")
     
     def process_video_list(self, video_list: List[Dict], mode: ProcessingMode = ProcessingMode.INCREMENTAL) -> Dict:
         """
         Process a list of videos with enhanced tracking and management
         
+        Downloads run in a pool of MAX_WORKERS threads ahead of transcription,
+        so the next videos are fetched while the current one transcribes
+        (the pool size also caps how much audio sits on disk at once), and
+        finished transcripts are written by a background writer thread. Only
+        this thread touches the Whisper model.
+        
         Args:
             video_list: List of video dictionaries with 'url' key
             mode: Processing mode
@@ -754,55 +1384,94 @@ class WhisperYouTubeExtractor:
         failed_urls = []
         unknown_urls = []
         
-        for i, video_data in enumerate(video_list):
-            try:
-                self.logger.info(f"📹 Processing video {i+1}/{len(video_list)}")
-                
-                result = self.process_single_video(video_data, mode)
+        # Videos with a valid transcript from an earlier run are skipped up
+        # front, without a trip through the download pool
+        if mode == ProcessingMode.INCREMENTAL:
+            to_process = []
+            for video_data in video_list:
+                match = VIDEO_ID_PATTERN.search(video_data.get('url', ''))
+                if match and match.group(1) in self._json_paths and \
+                   self.check_existing_transcript(match.group(1)):
+                    skipped += 1
+                else:
+                    to_process.append(video_data)
+            video_list = to_process
+            
+            if skipped:
+                self.logger.info(f"⏭️ Skipping {skipped} videos already transcribed")
+        
+        videos = iter(video_list)
+        pending = deque()  # (video_data, prepare future) in list order
+        
+        max_workers = max(1, self.cache_config.MAX_WORKERS)
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="download") as downloader, \
+             ThreadPoolExecutor(max_workers=1, thread_name_prefix="writer") as writer:
+            
+            def prefetch():
+                """Keep up to MAX_WORKERS downloads queued ahead of transcription"""
+                for video_data in islice(videos, max_workers - len(pending)):
+                    pending.append((video_data, downloader.submit(self._prepare, video_data, mode)))
+            
+            prefetch()
+            i = 0
+            while pending:
+                video_data, prepare_future = pending.popleft()
+                prefetch()
+                i += 1
                 
-                if result:
-                    personality = result.get('personality', 'unknown')
-                    results[personality].append(result)
+                try:
+                    self.logger.info(f"📹 Processing video {i}/{len(video_list)}")
                     
-                    # Track unknown personality videos
-                    if personality == 'unknown':
+                    prepared = prepare_future.result()
+                    if prepared and 'transcript_data' in prepared:
+                        result = prepared['transcript_data']
+                    elif prepared:
+                        result = self._transcribe_and_save(video_data, prepared, writer)
+                        
+                        # A repeated video still downloading shares this audio
+                        # file, whatever form its URL takes (playlist, youtu.be)
+                        pending_ids = {
+                            match.group(1) for match in
+                            (VIDEO_ID_PATTERN.search(queued.get('url', '')) for queued, _ in pending)
+                            if match
+                        }
+                        if prepared['video_id'] not in pending_ids:
+                            self._remove_audio(prepared)
+                    else:
+                        result = None
+                    
+                    if result:
+                        personality = result.get('personality', 'unknown')
+                        results[personality].append(result)
+                        
+                        # Track unknown personality videos
+                        if personality == 'unknown':
+                            url = video_data.get('url', '')
+                            title = result.get('video_info', {}).get('title', 'N/A')
+                            unknown_urls.append({'url': url, 'title': title})
+                            self.logger.warning(f"❌ Unknown video: {url} - Title: {title}")
+                        
+                        successful += 1
+                    else:
                         url = video_data.get('url', '')
-                        title = result.get('video_info', {}).get('title', 'N/A')
-                        unknown_urls.append({'url': url, 'title': title})
-                        print(f"❌ Unknown video: {url} - Title: {title}")
+                        failed_urls.append({'url': url, 'error': 'Processing failed'})
+                        self.logger.error(f"🚫 Failed to process: {url}")
+                        failed += 1
                     
-                    successful += 1
-                else:
+                except Exception as e:
                     url = video_data.get('url', '')
-                    failed_urls.append({'url': url, 'error': 'Processing failed'})
-                    print(f"🚫 Failed to process: {url}")
+                    failed_urls.append({'url': url, 'error': str(e)})
+                    self.logger.error(f"🚫 Unexpected error processing video {i} ({url}): {e}")
                     failed += 1
-                
-                # Small delay to avoid overwhelming the system
-                time.sleep(1)
-                
-            except Exception as e:
-                url = video_data.get('url', '')
-                failed_urls.append({'url': url, 'error': str(e)})
-                print(f"🚫 Failed to process: {url} - Error: {e}")
-                self.logger.error(f"Unexpected error processing video {i+1}: {e}")
-                failed += 1
         
+        # All transcript files are written once the writer pool has shut down
         # Post-processing cleanup and validation
         if mode != ProcessingMode.VALIDATE_ONLY:
-            # Create/update combined CSVs for each personality
+            # Rebuild combined CSVs for each personality (dedup and orphan cleanup included)
             for personality in ['networkchuck', 'bloomy']:
                 if results[personality] or mode == ProcessingMode.FORCE_ALL:
-                    self.create_combined_csv(personality)
-                    
-                    # Deduplicate if enabled
-                    if self.cache_config.ENABLE_DEDUPLICATION:
-                        csv_dir = self.get_csv_dir(personality)
-                        combined_csv = csv_dir / f"all_{personality}_transcripts.csv"
-                        self.deduplicate_csv(combined_csv)
-                    
-                    # Cleanup orphaned files
-                    self.cleanup_orphaned_files(personality)
+                    self.rebuild_personality(personality)
         
         # Data integrity validation
         if mode in [ProcessingMode.VALIDATE_ONLY, ProcessingMode.FORCE_ALL]:
@@ -856,6 +1525,23 @@ class WhisperYouTubeExtractor:
         
         return summary
     
+    async def process_video_list_async(self, video_list: List[Dict],
+                                       mode: ProcessingMode = ProcessingMode.INCREMENTAL) -> Dict:
+        """
+        Awaitable process_video_list for callers running an event loop
+        
+        The download/transcription pipeline runs in a worker thread, so the
+        loop stays responsive while videos are processed.
+        
+        Args:
+            video_list: List of video dictionaries with 'url' key
+            mode: Processing mode
+            
+        Returns:
+            Processing summary with detailed tracking
+        """
+        return await asyncio.to_thread(self.process_video_list, video_list, mode)
+    
     def cleanup_all(self):
         """
         Perform comprehensive cleanup
@@ -869,12 +1555,12 @@ class WhisperYouTubeExtractor:
         for personality in ['networkchuck', 'bloomy']:
             self.cleanup_orphaned_files(personality)
         
-        # Deduplicate all CSVs
+        # Deduplicate all CSVs (full consistency sweep)
         if self.cache_config.ENABLE_DEDUPLICATION:
             for personality in ['networkchuck', 'bloomy']:
                 csv_dir = self.get_csv_dir(personality)
                 combined_csv = csv_dir / f"all_{personality}_transcripts.csv"
-                self.deduplicate_csv(combined_csv)
+                self.deduplicate_csv(combined_csv, force=True)
         
         # Validate data integrity
         self.validate_data_integrity()
@@ -900,8 +1586,8 @@ class WhisperYouTubeExtractor:
             csv_dir = self.get_csv_dir(personality)
             combined_csv = csv_dir / f"all_{personality}_transcripts.csv"
             
-            json_count = len(list(json_dir.glob("*.json")))
-            individual_csv_count = len(list(csv_dir.glob("transcript_*.csv")))
+            json_count = count_files(json_dir, '.json')
+            individual_csv_count = count_files(csv_dir, '.csv', prefix='transcript_')
             
             personality_stats = {
                 'json_files': json_count,
@@ -912,22 +1598,32 @@ class WhisperYouTubeExtractor:
             # Get combined CSV stats
             if combined_csv.exists():
                 try:
-                    df = pd.read_csv(combined_csv)
-                    personality_stats.update({
-                        'total_segments': len(df),
-                        'unique_videos': df['video_id'].nunique(),
-                        'total_duration_hours': df['video_duration'].sum() / 3600
-                    })
+                    columns = ['video_id', 'video_duration']
+                    if pa is not None:
+                        # Aggregated in Arrow, no DataFrame is built
+                        table = read_combined_table(combined_csv, columns)
+                        personality_stats.update({
+                            'total_segments': table.num_rows,
+                            'unique_videos': pc.count_distinct(table['video_id']).as_py(),
+                            'total_duration_hours': (pc.sum(table['video_duration']).as_py() or 0) / 3600
+                        })
+                    else:
+                        df = read_csv(combined_csv, columns)
+                        personality_stats.update({
+                            'total_segments': len(df),
+                            'unique_videos': df['video_id'].nunique(),
+                            'total_duration_hours': df['video_duration'].sum() / 3600
+                        })
                 except Exception as e:
                     personality_stats['csv_error'] = str(e)
             
             stats['personalities'][personality] = personality_stats
         
         # Cache info
-        audio_files = list(self.audio_cache_dir.glob("*.wav"))
+        audio_count, audio_bytes = self.audio_cache_usage()
         stats['cache_info'] = {
-            'audio_files_cached': len(audio_files),
-            'audio_cache_size_mb': sum(f.stat().st_size for f in audio_files) / (1024 * 1024),
+            'audio_files_cached': audio_count,
+            'audio_cache_size_mb': audio_bytes / (1024 * 1024),
             'cache_config': {
                 'keep_audio': self.cache_config.KEEP_AUDIO,
                 'max_audio_age_days': self.cache_config.MAX_AUDIO_AGE_DAYS,
@@ -940,7 +1636,7 @@ class WhisperYouTubeExtractor:
 
 def process_from_json(json_file: str, model_size: str = "base", 
                      mode: ProcessingMode = ProcessingMode.INCREMENTAL,
-                     cache_config: CacheConfig = None) -> Dict:
+                     cache_config: CacheConfig = None, preload: bool = True) -> Dict:
     """
     Enhanced convenience function to process videos from JSON file
     
@@ -949,15 +1645,16 @@ def process_from_json(json_file: str, model_size: str = "base",
         model_size: Whisper model size
         mode: Processing mode
         cache_config: Cache configuration
+        preload: Load the Whisper model while the first videos download
         
     Returns:
         Processing summary with detailed tracking
     """
-    extractor = WhisperYouTubeExtractor(model_size=model_size, cache_config=cache_config)
+    extractor = WhisperYouTubeExtractor(model_size=model_size, cache_config=cache_config,
+                                        preload=preload)
     
-    # Load video data
-    with open(json_file, 'r') as f:
-        data = json.load(f)
+    # Load video data (orjson when available, like the transcript files)
+    data = read_json(Path(json_file))
     
     # Combine all videos
     all_videos = []
@@ -2,8 +2,11 @@
 Simple Clean Personality Tester - No debug noise, just results
 """
 
+import io
 import os
+import re
 import sys
+import contextlib
 from dotenv import load_dotenv
 
 # Add the project root to Python path
@@ -12,11 +15,34 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 load_dotenv()
 from src.core.chatbot import NetworkChuckChatbot
 
+# Style markers per personality (lowercase)
+_MARKERS = {
+    "NetworkChuck": ("coffee", "☕", "hey there", "alright", "brewing"),
+    "Bloomy": ("professional", "1.", "2.", "structured", "best practices"),
+    "EthicalHacker": ("security", "ethical", "vulnerability", "attack", "legal"),
+    "PatientTeacher": ("great question", "together", "understanding", "step by step"),
+    "StartupFounder": ("scalability", "business", "startup", "mvp", "market"),
+    "DataScientist": ("data", "analysis", "statistical", "evidence", "correlation")
+}
+
+# One case-insensitive alternation per personality, compiled at import: a
+# single scan of the response instead of one substring search per marker.
+# Markers match anywhere (no word boundaries), as "1." and "☕" need
+_MARKER_SCANNERS = {
+    personality: re.compile('|'.join(map(re.escape, markers)), re.I)
+    for personality, markers in _MARKERS.items()
+}
+
 
 class CleanPersonalityTester:
     """Simple personality tester with clean output"""
     
     def __init__(self):
+        # One chatbot for every test (suppress initialization output); its
+        # memory is cleared between tests instead of rebuilding the RAG stack
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.chatbot = NetworkChuckChatbot(max_turns=5)
+        
         self.personalities = [
             "NetworkChuck", "Bloomy", "EthicalHacker", 
             "PatientTeacher", "StartupFounder", "DataScientist"
@@ -40,20 +66,17 @@ class CleanPersonalityTester:
         for personality in self.personalities:
             print(f"\n🔬 Testing {personality}...")
             
-            # Create fresh chatbot (suppress initialization output)
-            import io
-            import contextlib
-            
+            # Fresh conversation (suppress output)
             f = io.StringIO()
             with contextlib.redirect_stdout(f):
-                chatbot = NetworkChuckChatbot(memory_window_size=5)
+                self.chatbot.clear_conversation_memory()
             
             question = self.questions[personality]
             
             try:
                 # Get response (suppress debug output)
                 with contextlib.redirect_stdout(f):
-                    response = chatbot.chat_response(question, [], personality)
+                    response = self.chatbot.chat_response(question, [], personality)
                 
                 # Analyze response
                 analysis = self.analyze_response(personality, response)
@@ -78,14 +101,11 @@ class CleanPersonalityTester:
         print(f"Question: {test_question}\n")
         
         for personality in self.personalities:
-            # Fresh chatbot with suppressed output
-            import io
-            import contextlib
-            
+            # Fresh conversation with suppressed output
             f = io.StringIO()
             with contextlib.redirect_stdout(f):
-                chatbot = NetworkChuckChatbot(memory_window_size=5)
-                response = chatbot.chat_response(test_question, [], personality)
+                self.chatbot.clear_conversation_memory()
+                response = self.chatbot.chat_response(test_question, [], personality)
             
             # Get first sentence of response
             first_sentence = response.split('.')[0][:100] + "..."
@@ -98,12 +118,10 @@ class CleanPersonalityTester:
         print("\n🧠 MEMORY TEST")
         print("=" * 50)
         
-        import io
-        import contextlib
-        
         f = io.StringIO()
         with contextlib.redirect_stdout(f):
-            chatbot = NetworkChuckChatbot(memory_window_size=5)
+            self.chatbot.clear_conversation_memory()
+        chatbot = self.chatbot
         
         history = []
         
@@ -126,19 +144,13 @@ class CleanPersonalityTester:
     
     def analyze_response(self, personality, response):
         """Simple response analysis"""
-        response_lower = response.lower()
-        
-        markers = {
-            "NetworkChuck": ["coffee", "☕", "hey there", "alright", "brewing"],
-            "Bloomy": ["professional", "1.", "2.", "structured", "best practices"],
-            "EthicalHacker": ["security", "ethical", "vulnerability", "attack", "legal"],
-            "PatientTeacher": ["great question", "together", "understanding", "step by step"],
-            "StartupFounder": ["scalability", "business", "startup", "mvp", "market"],
-            "DataScientist": ["data", "analysis", "statistical", "evidence", "correlation"]
-        }
+        scanner = _MARKER_SCANNERS.get(personality)
+        if scanner is None:
+            return {"markers": [], "score": 0}
         
-        personality_markers = markers.get(personality, [])
-        found = [m for m in personality_markers if m in response_lower]
+        # Reported in marker order, each marker once
+        hits = {match.group(0).lower() for match in scanner.finditer(response)}
+        found = [m for m in _MARKERS[personality] if m in hits]
         score = min(10, len(found) * 2)
         
         return {"markers": found, "score": score}
@@ -0,0 +1,116 @@
+"""
+On-disk embedding cache for the test suite
+Vectors are keyed by SHA-256 of (model, dimensions, input) and stored in a
+SQLite file in pytest's cache directory, so the fixed test queries are only
+embedded on the first run. When a warm-start file (tests/fixtures/
+query_embeddings.npz) is present it seeds fresh caches, e.g. on CI runners;
+it is not generated automatically. Write or refresh it, after changing test
+queries, with:
+
+    pytest tests/ --export-embeddings
+"""
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+WARM_START_PATH = Path(__file__).parent / "fixtures" / "query_embeddings.npz"
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed embedding cache with an in-memory layer in front of it.
+    create() wraps an embeddings.create call: only inputs missing from the
+    cache are sent, in one batched request, and the response is rebuilt in
+    the original input order.
+    """
+
+    def __init__(self, path: Path):
+        self.conn = sqlite3.connect(str(path), check_same_thread=False)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vec BLOB)")
+        self._memory: Dict[str, np.ndarray] = {}
+
+    @staticmethod
+    def key(model: str, dimensions: Optional[int], item) -> str:
+        """SHA-256 of one embedding input (a string or a list of token ids)"""
+        payload = json.dumps([model, dimensions, item], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        vector = self._memory.get(key)
+        if vector is None:
+            row = self.conn.execute("SELECT vec FROM embeddings WHERE key = ?", (key,)).fetchone()
+            if row:
+                vector = self._memory[key] = np.frombuffer(row[0], dtype=np.float32)
+        return vector
+
+    def put_many(self, items: Dict[str, List[float]]):
+        rows = []
+        for key, embedding in items.items():
+            vector = self._memory[key] = np.asarray(embedding, dtype=np.float32)
+            rows.append((key, vector.tobytes()))
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?)", rows)
+
+    def load_npz(self, path: Path) -> int:
+        """Seed the cache from an exported .npz; entries already cached win"""
+        data = np.load(path)
+        rows = [(str(key), np.asarray(vec, dtype=np.float32).tobytes())
+                for key, vec in zip(data['keys'], data['vecs'])]
+        with self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO embeddings VALUES (?, ?)", rows)
+        return len(rows)
+
+    def export_npz(self, path: Path) -> int:
+        """Write every cached vector to a compressed .npz (keys, vecs)"""
+        rows = self.conn.execute("SELECT key, vec FROM embeddings ORDER BY key").fetchall()
+        if not rows:
+            return 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            keys=np.array([key for key, _ in rows]),
+            vecs=np.stack([np.frombuffer(vec, dtype=np.float32) for _, vec in rows])
+        )
+        return len(rows)
+
+    def create(self, create_fn, *, input, model, **kwargs):
+        """Serve an embeddings.create call from the cache, embedding only the misses"""
+        from openai.types import CreateEmbeddingResponse, Embedding
+        from openai.types.create_embedding_response import Usage
+
+        # Base64 responses are decoded by the client; only cache float vectors
+        if isinstance(kwargs.get('encoding_format'), str) and kwargs['encoding_format'] != 'float':
+            return create_fn(input=input, model=model, **kwargs)
+
+        single = isinstance(input, str) or (input and isinstance(input[0], int))
+        items = [input] if single else list(input)
+        dimensions = kwargs.get('dimensions')
+        dimensions = dimensions if isinstance(dimensions, int) else None
+
+        keys = [self.key(model, dimensions, item) for item in items]
+        vectors = [self.get(key) for key in keys]
+        misses = [i for i, vector in enumerate(vectors) if vector is None]
+
+        if misses:
+            response = create_fn(input=[items[i] for i in misses], model=model, **kwargs)
+            fresh = {keys[misses[d.index]]: d.embedding for d in response.data}
+            self.put_many(fresh)
+            for i in misses:
+                vectors[i] = self._memory[keys[i]]
+
+        return CreateEmbeddingResponse(
+            data=[Embedding(embedding=v.tolist(), index=i, object="embedding")
+                  for i, v in enumerate(vectors)],
+            model=model,
+            object="list",
+            usage=Usage(prompt_tokens=0, total_tokens=0)
+        )
+
+    def close(self):
+        self.conn.close()
+
@@ -0,0 +1,72 @@
+"""
+Local flat inner-product vector index for the retriever tests
+Brute-force search over a small transcript corpus, standing in for Pinecone
+when the tests run with --local-vectorstore
+"""
+
+import csv
+from itertools import islice
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+
+TRANSCRIPTS_DIR = Path("data/processed")
+CORPUS_FILES = {
+    "networkchuck": "all_networkchuck_transcripts.csv",
+    "bloomy": "all_bloomy_transcripts.csv",
+}
+SEGMENTS_PER_PERSONALITY = 250
+
+
+def load_corpus(segments_per_personality: int = SEGMENTS_PER_PERSONALITY) -> list:
+    """Load the first transcript segments of each personality as Documents"""
+    from langchain_core.documents import Document
+
+    documents = []
+    for personality, filename in CORPUS_FILES.items():
+        with open(TRANSCRIPTS_DIR / filename, newline='', encoding='utf-8') as f:
+            rows = (row for row in csv.DictReader(f) if row['text'].strip())
+            for row in islice(rows, segments_per_personality):
+                documents.append(Document(
+                    page_content=row['text'],
+                    metadata={
+                        'personality': personality,
+                        'video_id': row['video_id'],
+                        'video_title': row['video_title'],
+                        'start_time': float(row['start_time']),
+                    }
+                ))
+    return documents
+
+
+class FlatIPVectorStore:
+    """
+    Exact nearest-neighbour search: one matrix-vector product against the
+    L2-normalised document embeddings, so scores are cosine similarities
+    like the production Pinecone index (metric='cosine').
+    Implements the two search methods RAGRetriever uses.
+    """
+
+    def __init__(self, embeddings, documents: list):
+        self.embeddings = embeddings
+        self.documents = documents
+        vectors = np.asarray(
+            embeddings.embed_documents([doc.page_content for doc in documents]),
+            dtype=np.float32
+        )
+        self.vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    def similarity_search_by_vector_with_score(self, embedding: List[float],
+                                               k: int = 4) -> List[Tuple]:
+        query = np.asarray(embedding, dtype=np.float32)
+        scores = self.vectors @ (query / np.linalg.norm(query))
+        k = min(k, len(scores))
+        top = np.argpartition(scores, -k)[-k:]
+        top = top[np.argsort(scores[top])[::-1]]
+        return [(self.documents[i], float(scores[i])) for i in top]
+
+    def similarity_search_with_score(self, query: str, k: int = 4) -> List[Tuple]:
+        return self.similarity_search_by_vector_with_score(
+            self.embeddings.embed_query(query), k=k
+        )
@@ -0,0 +1,69 @@
+"""
+Test queries shared by the extraction tests and their session fixtures
+"""
+
+# Queries sent to SmartDocumentationMatcher (same as in the notebook)
+DOC_MATCHER_QUERIES = (
+    "How to setup Docker containers",
+    "Excel VLOOKUP tutorial",
+    "Bloomberg Terminal guide",
+    "Hello there!"  # Should work but maybe get fewer/no matches
+)
+
+# Queries sent to RAGRetriever (same as in the notebook)
+RETRIEVER_QUERIES = (
+    "How to setup Docker containers",
+    "Excel VLOOKUP tutorial",
+    "VPN configuration guide"
+)
+
+# PersonalityPromptManager prompt-building scenarios
+PROMPT_SCENARIOS = (
+    {
+        "personality": "networkchuck",
+        "query": "How to setup Docker containers",
+        "context": "Docker containers are like shipping containers for applications...",
+        "stats": {'total_sources': 5, 'personalities': {'networkchuck': 5}, 'avg_score': 0.65}
+    },
+    {
+        "personality": "bloomy",
+        "query": "Excel VLOOKUP tutorial",
+        "context": "VLOOKUP is a powerful Excel function for data lookup...",
+        "stats": {'total_sources': 3, 'personalities': {'bloomy': 3}, 'avg_score': 0.72}
+    },
+    {
+        "personality": "networkchuck",
+        "query": "What is Kubernetes?",
+        "context": "Kubernetes is a container orchestration platform...",
+        "stats": {'total_sources': 4, 'personalities': {'networkchuck': 4}, 'avg_score': 0.58}
+    }
+)
+
+# End-to-end EnhancedRAGEngine scenarios (same as in the notebook)
+ENHANCED_RAG_SCENARIOS = (
+    {
+        "query": "How to setup Docker containers",
+        "personality": "networkchuck",
+        "expected_docs": True,
+        "description": "Technical NetworkChuck query"
+    },
+    {
+        "query": "Excel VLOOKUP tutorial",
+        "personality": "bloomy",
+        "expected_docs": True,
+        "description": "Technical Bloomy query"
+    },
+    {
+        "query": "Hello there!",
+        "personality": "networkchuck",
+        "expected_docs": False,
+        "description": "Casual query (should skip docs)"
+    }
+)
+
+# Every distinct query that reaches the retriever, in first-seen order; the
+# retriever test and the engine scenarios repeat most of them
+RETRIEVAL_TOP_K = 5
+RETRIEVAL_QUERIES = tuple(dict.fromkeys(
+    RETRIEVER_QUERIES + tuple(scenario["query"] for scenario in ENHANCED_RAG_SCENARIOS)
+))
@@ -0,0 +1,236 @@
+"""
+Shared test fixtures - heavy components are built once per test session
+"""
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from _embed_cache import WARM_START_PATH, EmbeddingCache
+from _flat_index import FlatIPVectorStore, load_corpus
+from _queries import DOC_MATCHER_QUERIES, RETRIEVAL_QUERIES, RETRIEVAL_TOP_K
+
+# Add the project root to path: the core package uses relative imports,
+# so it is imported as src.core (like app.py does)
+project_root = Path.cwd()
+sys.path.append(str(project_root))
+
+# Near-duplicate test queries (cosine >= threshold) share retrieval results
+RETRIEVAL_CACHE_THRESHOLD = 0.92
+RETRIEVAL_CACHE_SIZE = 64
+
+# HTTP record/replay settings shared by the per-test and session cassettes
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+VCR_CONFIG = {
+    "filter_headers": ["authorization", "api-key"],
+    "record_mode": "once",
+}
+
+# Modules the component fixtures need, checked without importing them
+REQUIRED_MODULES = ("openai", "numpy", "dotenv")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--local-vectorstore", action="store_true",
+        help="search a local index over a transcript sample instead of Pinecone"
+    )
+    parser.addoption(
+        "--export-embeddings", action="store_true",
+        help=f"write the session's embedding cache to {WARM_START_PATH.name} for fresh runs"
+    )
+
+
+def pytest_configure(config):
+    # Registered here too so the marker is known without pytest-recording
+    config.addinivalue_line("markers", "vcr: record/replay the test's HTTP calls")
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """
+    pytest-recording settings for tests marked vcr: record each test's HTTP
+    calls once into tests/cassettes, then replay them; API keys are never
+    written to a cassette
+    """
+    return dict(VCR_CONFIG)
+
+
+@pytest.fixture(scope="module")
+def vcr_cassette_dir():
+    return str(CASSETTE_DIR)
+
+
+@pytest.fixture(scope="session")
+def session_cassette():
+    """
+    Cassette for the session fixtures' HTTP calls. They are set up before a
+    test's own cassette is inserted, so the component fixtures depend on this
+    one to have their calls recorded and replayed too (needs vcrpy, which
+    pytest-recording installs).
+    """
+    try:
+        import vcr
+    except ImportError:
+        yield None
+        return
+
+    with vcr.use_cassette(str(CASSETTE_DIR / "session_fixtures.yaml"), **VCR_CONFIG) as cassette:
+        yield cassette
+
+
+@pytest.fixture(scope="session", autouse=True)
+def embedding_cache(request):
+    """
+    Route every OpenAI embeddings request (direct client and LangChain)
+    through the on-disk cache, so repeated test queries are embedded once.
+    The cache lives in pytest's cache directory (resolved from the rootdir);
+    --export-embeddings writes it to the warm-start file at session end.
+    """
+    try:
+        from openai.resources.embeddings import Embeddings
+    except ImportError:
+        yield None
+        return
+
+    cache = EmbeddingCache(request.config.cache.mkdir("embeddings") / "embed_cache.sqlite")
+    if WARM_START_PATH.exists():
+        cache.load_npz(WARM_START_PATH)
+    original_create = Embeddings.create
+
+    def cached_create(self, *, input, model, **kwargs):
+        return cache.create(
+            lambda **kw: original_create(self, **kw), input=input, model=model, **kwargs
+        )
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Embeddings, "create", cached_create)
+        yield cache
+    if request.config.getoption("--export-embeddings"):
+        count = cache.export_npz(WARM_START_PATH)
+        print(f"\n✅ Exported {count} embeddings to {WARM_START_PATH}")
+    cache.close()
+
+
+@pytest.fixture(scope="session")
+def env_ok():
+    """
+    Check the required modules are installed and load .env, once per session.
+    Returns whether OPENAI_API_KEY is set.
+    """
+    missing = [name for name in REQUIRED_MODULES if importlib.util.find_spec(name) is None]
+    if missing:
+        pytest.skip(f"missing test dependencies: {', '.join(missing)}")
+
+    from dotenv import load_dotenv
+    load_dotenv()
+    return bool(os.getenv('OPENAI_API_KEY'))
+
+
+@pytest.fixture(scope="session")
+def doc_matcher(env_ok, session_cassette):
+    """SmartDocumentationMatcher (embeds the documentation database once)"""
+    from src.core.doc_matcher import SmartDocumentationMatcher
+    return SmartDocumentationMatcher()
+
+
+@pytest.fixture(scope="session")
+def retriever(request, env_ok, session_cassette):
+    """
+    RAGRetriever (one Pinecone connection for the whole session, or a local
+    flat index over a transcript sample with --local-vectorstore)
+    """
+    pytest.importorskip("langchain_pinecone")
+    from src.core.retriever import RAGRetriever
+    if not request.config.getoption("--local-vectorstore"):
+        return RAGRetriever()
+
+    from langchain_openai import OpenAIEmbeddings
+    embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
+    return RAGRetriever(vectorstore=FlatIPVectorStore(embeddings, load_corpus()))
+
+
+@pytest.fixture(scope="session")
+def prompt_manager():
+    """PersonalityPromptManager"""
+    from src.core.personality import PersonalityPromptManager
+    return PersonalityPromptManager()
+
+
+@pytest.fixture(scope="session")
+def enhanced_rag(retriever, prompt_manager, doc_matcher, retrieval_cache):
+    """
+    EnhancedRAGEngine sharing the session components above; its retrieval
+    step is served from retrieval_cache for queries already retrieved or
+    near-duplicates of them
+    """
+    from src.core.enhanced_rag import EnhancedRAGEngine
+    engine = EnhancedRAGEngine(retriever, prompt_manager, doc_matcher)
+
+    retrieve_context = retriever.retrieve_context
+
+    def cached_retrieve_context(query, top_k=5, **kwargs):
+        if top_k != RETRIEVAL_TOP_K:
+            return retrieve_context(query, top_k, **kwargs)
+        results, vector = retrieval_cache.lookup(query)
+        if results is None:
+            results = retrieve_context(query, top_k, query_embedding=vector.tolist(), **kwargs)
+            retrieval_cache.add(query, results, vector)
+        return results
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(retriever, "retrieve_context", cached_retrieve_context)
+        yield engine
+
+
+@pytest.fixture(scope="session")
+def doc_query_embeddings(doc_matcher):
+    """Search embeddings for every doc matcher test query, from one batched request"""
+    return doc_matcher.embed_queries(DOC_MATCHER_QUERIES)
+
+
+@pytest.fixture(scope="session")
+def doc_similarities(doc_matcher, doc_query_embeddings):
+    """Similarity of every doc matcher test query to every doc, from one matmul"""
+    from src.core.doc_matcher import batched_cosine
+    queries = list(doc_query_embeddings)
+    matrix = batched_cosine(np.stack([doc_query_embeddings[q] for q in queries]),
+                            doc_matcher.doc_embeddings)
+    return dict(zip(queries, matrix))
+
+
+@pytest.fixture(scope="session")
+def retriever_query_embeddings(retriever):
+    """Embeddings for every distinct retrieval query, from one batched request"""
+    return retriever.embed_queries(RETRIEVAL_QUERIES)
+
+
+@pytest.fixture(scope="session")
+def retrieval_results(retriever, retriever_query_embeddings):
+    """Context for every distinct retrieval query, retrieved once per session"""
+    return {
+        query: retriever.retrieve_context(query, top_k=RETRIEVAL_TOP_K, query_embedding=vector)
+        for query, vector in retriever_query_embeddings.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def retrieval_cache(retriever, retriever_query_embeddings, retrieval_results):
+    """
+    SemanticCache seeded with the session's retrieval results, so a query
+    close enough to one already retrieved reuses its context
+    """
+    from src.core.semantic_cache import SemanticCache
+    cache = SemanticCache(
+        retriever.embeddings.embed_query,
+        threshold=RETRIEVAL_CACHE_THRESHOLD,
+        max_entries=RETRIEVAL_CACHE_SIZE
+    )
+    for query, results in retrieval_results.items():
+        vector = np.asarray(retriever_query_embeddings[query], dtype=np.float32)
+        cache.add(query, results, vector / np.linalg.norm(vector))
+    return cache
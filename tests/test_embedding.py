@@ -4,12 +4,28 @@ Quick test script for the embedding system using LangChain
 """
 
 import os
+import functools
 from dotenv import load_dotenv
 from langchain_openai import OpenAIEmbeddings
 from pinecone import Pinecone
 
 load_dotenv()
 
+# Embedding probe: several inputs in one request, checking the batched call
+# the pipeline relies on returns one vector per input
+EMBEDDING_PROBE = ["probe"] * 8
+
+@functools.lru_cache(maxsize=1)
+def _openai_client():
+    """Process-wide OpenAI client, so repeated checks reuse its connections"""
+    from openai import OpenAI
+    return OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+
+@functools.lru_cache(maxsize=1)
+def _pinecone_client():
+    """Process-wide Pinecone client"""
+    return Pinecone(api_key=os.getenv('PINECONE_API_KEY'))
+
 def test_openai_connection():
     """Test OpenAI API connection using working approach"""
     try:
@@ -20,9 +36,10 @@ def test_openai_connection():
         # Test embeddings using the older working syntax
         response = openai.Embedding.create(
             model="text-embedding-3-small",
-            input=["Hello, this is a test"]
+            input=EMBEDDING_PROBE
         )
         
+        assert len(response['data']) == len(EMBEDDING_PROBE)
         embedding_vector = response['data'][0]['embedding']
         
         print("✅ OpenAI connection successful!")
@@ -35,14 +52,14 @@ def test_openai_connection():
         
         # Try the new client approach as fallback
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+            client = _openai_client()
             
             response = client.embeddings.create(
                 model="text-embedding-3-small",
-                input=["test"]
+                input=EMBEDDING_PROBE
             )
             
+            assert len(response.data) == len(EMBEDDING_PROBE)
             print("✅ OpenAI (new client) connection successful!")
             print(f"   Embedding dimension: {len(response.data[0].embedding)}")
             return True
@@ -54,7 +71,7 @@ def test_openai_connection():
 def test_pinecone_connection():
     """Test Pinecone connection"""
     try:
-        pc = Pinecone(api_key=os.getenv('PINECONE_API_KEY'))
+        pc = _pinecone_client()
         
         # List existing indexes
         indexes = [index.name for index in pc.list_indexes()]
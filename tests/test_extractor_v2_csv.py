@@ -0,0 +1,66 @@
+"""
+Test the v2 extractor's combined CSV updates
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+project_root = Path.cwd()
+sys.path.append(str(project_root / 'src'))
+
+pytest.importorskip("yt_dlp")
+extractor_v2 = pytest.importorskip("whisper_youtube_extractor_v2")
+
+
+def make_transcript(video_id, texts):
+    """Transcript data as the transcription stage hands it to the write stage"""
+    return {
+        'video_id': video_id,
+        'video_url': f"https://www.youtube.com/watch?v={video_id}",
+        'personality': 'networkchuck',
+        'domain': 'technology_networking',
+        'language': 'en',
+        'expertise_areas': ['networking', 'linux'],
+        'video_info': {
+            'title': f"Video {video_id}",
+            'uploader': 'NetworkChuck',
+            'upload_date': '20230101',
+            'duration': 600,
+        },
+        'segments': [
+            {'start': i * 5.0, 'end': i * 5.0 + 5.0, 'text': f" {text}"}
+            for i, text in enumerate(texts)
+        ],
+    }
+
+
+@pytest.fixture
+def extractor(tmp_path, monkeypatch):
+    """Extractor whose data directories live under a temporary directory"""
+    monkeypatch.chdir(tmp_path)
+    return extractor_v2.WhisperYouTubeExtractor()
+
+
+def test_reprocessed_video_replaces_its_rows(extractor):
+    """Reprocessing a video rewrites its combined CSV rows, keeping the others"""
+    combined_csv = extractor.get_csv_dir('networkchuck') / "all_networkchuck_transcripts.csv"
+
+    extractor._save_transcript_files(make_transcript("aaaaaaaaaaa", ["one", "two"]), "hash-a")
+    extractor._save_transcript_files(make_transcript("bbbbbbbbbbb", ["three"]), "hash-b")
+
+    # A fresh extractor reads the stored CSV back, as a later run would
+    extractor._combined_ids.clear()
+    extractor._save_transcript_files(
+        make_transcript("aaaaaaaaaaa", ["one again", "two again", "three again"]), "hash-a2"
+    )
+
+    df = extractor_v2.read_csv(combined_csv)
+    assert not combined_csv.with_suffix('.csv.tmp').exists()
+    assert df['video_id'].value_counts().to_dict() == {"aaaaaaaaaaa": 3, "bbbbbbbbbbb": 1}
+    assert list(df.loc[df['video_id'] == "aaaaaaaaaaa", 'text']) == [
+        "one again", "two again", "three again"
+    ]
+    assert set(df['upload_date']) == {"20230101"}
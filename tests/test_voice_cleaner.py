@@ -0,0 +1,55 @@
+"""
+Test voice text cleaning for TTS
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+project_root = Path.cwd()
+sys.path.append(str(project_root / 'src'))
+
+from utils.voice_cleaner import clean_text_for_voice, extract_voice_content, iter_voice_sentences
+
+
+@pytest.mark.parametrize("original", [
+    "**Docker** is a *containerization* platform that lets you package applications.",
+    "Here's how to secure your network:\n• Use strong passwords\n• Enable firewall\n• Update regularly",
+    "Check out this video: [Docker Tutorial](https://youtube.com/watch?v=123) for more info.",
+    "🎥 **Source Videos:**\n1. **[Docker Basics](https://example.com)**\n• 5:30\n\nDocker is amazing! *Really* **powerful** stuff.",
+    "```bash\necho 'Hello World'\n```\nThis command prints text with **formatting** and *emphasis*.",
+])
+def test_voice_cleaning(original):
+    """Test the voice text cleaning functionality"""
+    cleaned = clean_text_for_voice(original)
+    assert cleaned
+    assert "*" not in cleaned
+    assert cleaned == cleaned.strip()
+
+
+@pytest.mark.parametrize("original,expected", [
+    # Trailing sentence punctuation is not part of the URL
+    ("See https://docs.docker.com/get-started/.", "See ."),
+    ("Links: https://a.com, https://b.com; done!", "Links: , ; done!"),
+    # Markdown links keep their text
+    ("Check out this video: [Docker Tutorial](https://youtube.com/watch?v=123) for more info.",
+     "Check out this video: Docker Tutorial for more info."),
+    # Non-ASCII text after a URL is left alone
+    ("Open https://x.com/page über today", "Open über today"),
+])
+def test_url_removal(original, expected):
+    """URLs are removed without eating surrounding text"""
+    assert clean_text_for_voice(original) == expected
+
+
+def test_voice_sentences_match_full_extraction():
+    """Streaming sentences join back to the same text as the one-shot extraction"""
+    response = (
+        "Docker is **great**. Here's why:\n1. Fast startup!\n2. Small images\n"
+        "🎥 **Source Videos:**\n• [Docker Basics](https://example.com)\n\nThat's it?"
+    )
+    sentences = list(iter_voice_sentences(response))
+    assert len(sentences) > 1
+    assert " ".join(sentences) == extract_voice_content(response)